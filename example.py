@@ -1,5 +1,6 @@
 """Example script demonstrating programmatic usage of the AI Course Creator."""
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -125,31 +126,37 @@ def example_multiple_providers():
         complexity="Beginner"
     )
     
-    # Try OpenAI if available
+    # Collect every provider with a configured API key
+    tasks = []
     if config.openai_api_key:
-        print("\n--- Using OpenAI ---")
-        openai_provider = ProviderFactory.create_provider(
+        tasks.append(("OpenAI", ProviderFactory.create_provider(
             provider_name="openai",
             api_key=config.openai_api_key,
             model="gpt-4o-mini"
-        )
-        service = SyllabusService(ai_provider=openai_provider)
-        syllabus = service.generate_syllabus(course_input)
-        print(f"Generated: {syllabus.course_title}")
-        print(f"Modules: {len(syllabus.modules)}")
-    
-    # Try Gemini if available
+        )))
     if config.gemini_api_key:
-        print("\n--- Using Google Gemini ---")
-        gemini_provider = ProviderFactory.create_provider(
+        tasks.append(("Google Gemini", ProviderFactory.create_provider(
             provider_name="gemini",
             api_key=config.gemini_api_key,
             model="gemini-1.5-flash"
-        )
-        service = SyllabusService(ai_provider=gemini_provider)
-        syllabus = service.generate_syllabus(course_input)
+        )))
+    
+    if not tasks:
+        print("Error: No API key found.")
+        return
+    
+    async def generate(name, provider):
+        service = SyllabusService(ai_provider=provider)
+        syllabus = await service.agenerate_syllabus(course_input)
+        print(f"\n--- Using {name} ---")
         print(f"Generated: {syllabus.course_title}")
         print(f"Modules: {len(syllabus.modules)}")
+    
+    async def generate_all():
+        # The provider calls are independent, so run them concurrently
+        await asyncio.gather(*(generate(name, provider) for name, provider in tasks))
+    
+    asyncio.run(generate_all())
 
 
 def main():
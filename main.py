@@ -1,19 +1,52 @@
 """AI Course Creator - Main Entry Point."""
 
+import argparse
 import os
+import re
 import sys
+import threading
 from pathlib import Path
+from typing import Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from src.config import Config
+from src.models.course_input import CourseInput
 from src.models.syllabus import Syllabus
 from src.providers import ProviderFactory
-from src.services import SyllabusService
+from src.services import DiskCache, SemanticCache, SyllabusService, SyllabusStore
 from src.utils import InputCollector, Display
 
 
+# Characters dropped from filenames: anything other than letters, digits
+# and whitespace (\w also matches "_", so it is listed explicitly)
+_FILENAME_STRIP_RE = re.compile(r"[^\w\s]|_")
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+    
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(
+        description="AI Course Creator - Syllabus Generator"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the AI provider instead of reusing cached syllabi"
+    )
+    parser.add_argument(
+        "--exact-only",
+        action="store_true",
+        help="Only reuse cached syllabi for identical requests, not similar topics"
+    )
+    return parser.parse_args()
+
+
 def setup_api_keys(config: Config) -> tuple[str, str]:
     """
     Setup and validate API keys.
@@ -64,6 +97,36 @@ def setup_api_keys(config: Config) -> tuple[str, str]:
     return provider, api_key
 
 
+def start_provider_warmup(config: Config) -> None:
+    """
+    Create the configured provider and warm it up in a background thread.
+    
+    Called once the topic is entered, so client setup and the first
+    connection overlap with the user answering the remaining questions.
+    Skipped when no API key is configured, since the provider is then
+    chosen interactively later.
+    
+    Args:
+        config: Configuration object
+    """
+    if not (config.openai_api_key or config.gemini_api_key):
+        return
+    
+    def warmup() -> None:
+        try:
+            provider_name, api_key = setup_api_keys(config)
+            ProviderFactory.create_provider(
+                provider_name=provider_name,
+                api_key=api_key,
+                model=config.get_model(provider_name)
+            ).warmup()
+        except Exception:
+            # Best-effort; the real setup below reports any problem
+            pass
+    
+    threading.Thread(target=warmup, daemon=True).start()
+
+
 def save_syllabus(syllabus: Syllabus, output_dir: str = "output") -> str:
     """
     Save syllabus to a markdown file.
@@ -79,57 +142,104 @@ def save_syllabus(syllabus: Syllabus, output_dir: str = "output") -> str:
     Path(output_dir).mkdir(exist_ok=True)
     
     # Generate filename from course title
-    filename = syllabus.course_title.lower()
-    filename = "".join(c if c.isalnum() or c.isspace() else "" for c in filename)
+    filename = _FILENAME_STRIP_RE.sub("", syllabus.course_title.lower())
     filename = "_".join(filename.split()) + "_syllabus.md"
     
     filepath = Path(output_dir) / filename
     
     # Write markdown content
     with open(filepath, "w", encoding="utf-8") as f:
-        f.write(syllabus.to_markdown())
+        syllabus.write_markdown(f)
     
     return str(filepath)
 
 
+def generate_syllabus(
+    args: argparse.Namespace,
+    config: Config,
+    course_input: CourseInput
+) -> Optional[Syllabus]:
+    """
+    Set up the AI provider and generate a syllabus, displaying it as it arrives.
+    
+    Args:
+        args: Parsed command-line arguments
+        config: Configuration object
+        course_input: User's course requirements
+        
+    Returns:
+        Generated syllabus, or None if the API key is invalid
+    """
+    # Setup API provider
+    Display.print_info("Setting up AI provider...")
+    provider_name, api_key = setup_api_keys(config)
+    model = config.get_model(provider_name)
+    
+    # Create provider instance
+    Display.print_info(f"Using {provider_name.upper()} with model {model}")
+    provider = ProviderFactory.create_provider(
+        provider_name=provider_name,
+        api_key=api_key,
+        model=model
+    )
+    
+    # Validate API key
+    Display.print_info("Validating API key...")
+    if not provider.validate_api_key():
+        Display.print_error("Invalid API key. Please check your credentials.")
+        return None
+    
+    # Create syllabus service
+    cache = None if args.no_cache else DiskCache()
+    semantic_cache = None
+    if not (args.no_cache or args.exact_only):
+        semantic_cache = SemanticCache(embed=provider.embed_text)
+    syllabus_service = SyllabusService(
+        ai_provider=provider,
+        cache=cache,
+        semantic_cache=semantic_cache
+    )
+    
+    # Generate syllabus, displaying each module as it arrives
+    Display.print_info("Generating syllabus... This may take a moment.")
+    syllabus = Display.print_syllabus(
+        syllabus_service.generate_syllabus_stream(course_input)
+    )
+    
+    return syllabus
+
+
 def main():
     """Main function to run the syllabus generator."""
+    args = parse_args()
+    
     try:
         # Load configuration
         config = Config.from_env()
         
-        # Collect user inputs
-        course_input = InputCollector.collect_course_inputs()
-        Display.print_course_inputs(course_input)
-        
-        # Setup API provider
-        Display.print_info("Setting up AI provider...")
-        provider_name, api_key = setup_api_keys(config)
-        model = config.get_model(provider_name)
-        
-        # Create provider instance
-        Display.print_info(f"Using {provider_name.upper()} with model {model}")
-        provider = ProviderFactory.create_provider(
-            provider_name=provider_name,
-            api_key=api_key,
-            model=model
+        # Collect user inputs, warming up the provider while they are typed
+        course_input = InputCollector.collect_course_inputs(
+            on_topic=lambda topic: start_provider_warmup(config)
         )
+        Display.print_course_inputs(course_input)
         
-        # Validate API key
-        Display.print_info("Validating API key...")
-        if not provider.validate_api_key():
-            Display.print_error("Invalid API key. Please check your credentials.")
-            return
-        
-        # Create syllabus service
-        syllabus_service = SyllabusService(ai_provider=provider)
-        
-        # Generate syllabus
-        Display.print_info("Generating syllabus... This may take a moment.")
-        syllabus = syllabus_service.generate_syllabus(course_input)
+        # Show the syllabus generated earlier for the same inputs, if any
+        store = None if args.no_cache else SyllabusStore()
+        store_key = SyllabusStore.make_key(course_input)
+        syllabus = store.get(store_key) if store else None
         
-        # Display syllabus
-        Display.print_syllabus(syllabus)
+        if syllabus is not None:
+            Display.print_info(
+                "Showing the syllabus generated earlier for these inputs "
+                "(use --no-cache to generate a new one)."
+            )
+            Display.print_syllabus(syllabus)
+        else:
+            syllabus = generate_syllabus(args, config, course_input)
+            if syllabus is None:
+                return
+            if store:
+                store.put(store_key, syllabus)
         
         # Save to file
         output_path = save_syllabus(syllabus)
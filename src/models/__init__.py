@@ -1,6 +1,6 @@
 """Data models for the AI Course Creator."""
 
-from .course_input import CourseInput
+from .course_input import CourseInput, validate_topic
 from .syllabus import Syllabus, Module, Lesson
 
-__all__ = ["CourseInput", "Syllabus", "Module", "Lesson"]
+__all__ = ["CourseInput", "Syllabus", "Module", "Lesson", "validate_topic"]
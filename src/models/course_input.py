@@ -1,12 +1,38 @@
 """Course input data model."""
 
+import json
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass
+# Keyboard mashes and punctuation-only input, matched against the whole
+# (case-folded) topic. Only unambiguous junk: short topics such as "C" or
+# "R" and words such as "Testing" are real subjects.
+_JUNK_TOPIC_RE = re.compile(r"asdf\w*|qwerty\w*|x{3,}|[\W_]*")
+
+
+def validate_topic(topic: str) -> None:
+    """
+    Check that a topic is worth generating a syllabus for.
+    
+    Args:
+        topic: Course topic entered by the user
+        
+    Raises:
+        ValueError: If the topic is empty or junk
+    """
+    normalized = " ".join(topic.split()).casefold()
+    if not normalized:
+        raise ValueError("Topic cannot be empty")
+    if _JUNK_TOPIC_RE.fullmatch(normalized):
+        raise ValueError(f"'{topic.strip()}' is not a course topic")
+
+
+@dataclass(frozen=True, slots=True)
 class CourseInput:
-    """User input for course generation."""
+    """User input for course generation. Immutable, so it can be hashed."""
     
     topic: str
     complexity: Optional[str] = None
@@ -22,6 +48,14 @@ class CourseInput:
             "tone": self.tone
         }
     
+    def to_canonical_json(self) -> bytes:
+        """
+        Get a stable serialization of the input, for hashing.
+        
+        Equal inputs always give identical bytes (keys are sorted).
+        """
+        return _canonical_json(self)
+    
     def __str__(self) -> str:
         """String representation for display."""
         lines = [
@@ -31,3 +65,9 @@ class CourseInput:
             f"Tone/Style: {self.tone or 'Not specified'}"
         ]
         return "\n".join(lines)
+
+
+@lru_cache(maxsize=256)
+def _canonical_json(course_input: CourseInput) -> bytes:
+    """Serialize a course input, reusing the bytes for repeated lookups."""
+    return json.dumps(course_input.to_dict(), sort_keys=True).encode("utf-8")
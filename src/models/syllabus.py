@@ -1,10 +1,17 @@
 """Syllabus data models."""
 
+import io
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, TextIO, Union
 
+try:
+    import msgspec
+except ImportError:
+    # msgspec not installed, use the pure-Python parser only
+    msgspec = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Lesson:
     """Represents a single lesson within a module."""
     
@@ -12,9 +19,42 @@ class Lesson:
     description: Optional[str] = None
     duration_minutes: Optional[int] = None
     learning_objectives: List[str] = field(default_factory=list)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Lesson":
+        """
+        Build a lesson from raw response data.
+        
+        Args:
+            data: Raw lesson data
+        """
+        get = data.get
+        return cls(
+            title=get("title", ""),
+            description=get("description"),
+            duration_minutes=get("duration_minutes"),
+            learning_objectives=get("learning_objectives", [])
+        )
+    
+    def to_markdown(self, number: int) -> str:
+        """
+        Convert lesson to a markdown list item.
+        
+        Args:
+            number: Position of the lesson within its module, starting at 1
+        """
+        duration = f" ({self.duration_minutes} min)" if self.duration_minutes else ""
+        description = f"\n   - {self.description}" if self.description else ""
+        objectives = (
+            "\n   - Learning Objectives:"
+            + "".join(f"\n     - {obj}" for obj in self.learning_objectives)
+            if self.learning_objectives else ""
+        )
+        
+        return f"{number}. {self.title}{duration}{description}{objectives}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Module:
     """Represents a module/section in the course."""
     
@@ -22,9 +62,49 @@ class Module:
     description: Optional[str] = None
     lessons: List[Lesson] = field(default_factory=list)
     order: int = 0
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Module":
+        """
+        Build a module, including its lessons, from raw response data.
+        
+        Args:
+            data: Raw module data
+        """
+        get = data.get
+        return cls(
+            title=get("title", ""),
+            description=get("description"),
+            lessons=[Lesson.from_dict(lesson) for lesson in get("lessons", [])],
+            order=get("order", 0)
+        )
+    
+    def to_markdown(self, number: int) -> str:
+        """
+        Convert module to markdown format.
+        
+        Args:
+            number: Position of the module within the course, starting at 1
+        """
+        # Each section ends with its own blank line; sections are joined
+        # with a newline and empty (absent) sections are skipped
+        lessons_block = (
+            "**Lessons:**\n"
+            + "\n".join(
+                lesson.to_markdown(idx) for idx, lesson in enumerate(self.lessons, 1)
+            )
+            + "\n"
+            if self.lessons else ""
+        )
+        
+        return "\n".join(filter(None, [
+            f"### Module {number}: {self.title}\n",
+            f"{self.description}\n" if self.description else "",
+            lessons_block
+        ]))
 
 
-@dataclass
+@dataclass(slots=True)
 class Syllabus:
     """Complete course syllabus structure."""
     
@@ -34,74 +114,95 @@ class Syllabus:
     prerequisites: List[str] = field(default_factory=list)
     learning_outcomes: List[str] = field(default_factory=list)
     modules: List[Module] = field(default_factory=list)
-    total_duration_hours: Optional[float] = None
+    # int is listed so msgspec keeps whole numbers as given ("10 hours",
+    # not "10.0 hours")
+    total_duration_hours: Optional[Union[int, float]] = None
     
-    def to_markdown(self) -> str:
-        """Convert syllabus to markdown format."""
-        md_lines = [
-            f"# {self.course_title}",
-            "",
-            "## Course Description",
-            self.course_description,
-            ""
-        ]
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Syllabus":
+        """
+        Build a syllabus, including modules and lessons, from raw response data.
         
-        if self.target_audience:
-            md_lines.extend([
-                "## Target Audience",
-                self.target_audience,
-                ""
-            ])
+        With msgspec installed, well-typed data is converted in a single
+        compiled pass; anything it rejects (e.g. null lists or missing
+        fields) falls back to the lenient Python parser.
         
-        if self.prerequisites:
-            md_lines.extend([
-                "## Prerequisites",
-                *[f"- {prereq}" for prereq in self.prerequisites],
-                ""
-            ])
+        Args:
+            data: Raw syllabus data
+        """
+        if msgspec is not None:
+            try:
+                return msgspec.convert(data, type=cls)
+            except msgspec.ValidationError:
+                pass
         
-        if self.learning_outcomes:
-            md_lines.extend([
-                "## Learning Outcomes",
-                *[f"- {outcome}" for outcome in self.learning_outcomes],
-                ""
-            ])
+        get = data.get
+        return cls(
+            course_title=get("course_title", ""),
+            course_description=get("course_description", ""),
+            target_audience=get("target_audience"),
+            prerequisites=get("prerequisites", []),
+            learning_outcomes=get("learning_outcomes", []),
+            modules=[Module.from_dict(module) for module in get("modules", [])],
+            total_duration_hours=get("total_duration_hours")
+        )
+    
+    def to_markdown(self) -> str:
+        """Convert syllabus to markdown format."""
+        buffer = io.StringIO()
+        self.write_markdown(buffer)
+        return buffer.getvalue()
+    
+    def write_markdown(self, f: TextIO) -> None:
+        """
+        Write syllabus in markdown format, one section at a time.
         
-        if self.total_duration_hours:
-            md_lines.extend([
-                f"## Total Duration: {self.total_duration_hours} hours",
-                ""
-            ])
+        Args:
+            f: Text file or stream to write to
+        """
+        f.write(self.to_markdown_header())
+        for idx, module in enumerate(self.modules, 1):
+            f.write("\n")
+            f.write(module.to_markdown(idx))
+    
+    @staticmethod
+    def to_markdown_batch(syllabi: List["Syllabus"]) -> str:
+        """
+        Convert several syllabi to a single markdown document.
         
-        md_lines.append("## Course Modules")
-        md_lines.append("")
+        All syllabi are written into one buffer instead of building and
+        joining a separate string per syllabus.
         
-        for idx, module in enumerate(self.modules, 1):
-            md_lines.extend([
-                f"### Module {idx}: {module.title}",
-                ""
-            ])
-            
-            if module.description:
-                md_lines.extend([
-                    module.description,
-                    ""
-                ])
+        Args:
+            syllabi: Syllabi to export, in order
             
-            if module.lessons:
-                md_lines.append("**Lessons:**")
-                for lesson_idx, lesson in enumerate(module.lessons, 1):
-                    duration = f" ({lesson.duration_minutes} min)" if lesson.duration_minutes else ""
-                    md_lines.append(f"{lesson_idx}. {lesson.title}{duration}")
-                    
-                    if lesson.description:
-                        md_lines.append(f"   - {lesson.description}")
-                    
-                    if lesson.learning_objectives:
-                        md_lines.append("   - Learning Objectives:")
-                        for obj in lesson.learning_objectives:
-                            md_lines.append(f"     - {obj}")
-                
-                md_lines.append("")
-        
-        return "\n".join(md_lines)
+        Returns:
+            Markdown with the syllabi separated by horizontal rules
+        """
+        buffer = io.StringIO()
+        for idx, syllabus in enumerate(syllabi):
+            if idx:
+                buffer.write("\n---\n\n")
+            syllabus.write_markdown(buffer)
+        return buffer.getvalue()
+    
+    def to_markdown_header(self) -> str:
+        """Convert everything preceding the modules to markdown format."""
+        return f"{self.to_markdown_details()}\n## Course Modules\n"
+    
+    def to_markdown_details(self) -> str:
+        """Convert the course details (title through duration) to markdown format."""
+        # Each section ends with its own blank line; sections are joined
+        # with a newline and empty (absent) sections are skipped
+        return "\n".join(filter(None, [
+            f"# {self.course_title}\n\n## Course Description\n{self.course_description}\n",
+            f"## Target Audience\n{self.target_audience}\n" if self.target_audience else "",
+            "## Prerequisites\n"
+            + "".join(f"- {prereq}\n" for prereq in self.prerequisites)
+            if self.prerequisites else "",
+            "## Learning Outcomes\n"
+            + "".join(f"- {outcome}\n" for outcome in self.learning_outcomes)
+            if self.learning_outcomes else "",
+            f"## Total Duration: {self.total_duration_hours} hours\n"
+            if self.total_duration_hours else ""
+        ]))
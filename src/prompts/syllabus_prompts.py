@@ -1,6 +1,104 @@
 """Prompt templates for syllabus generation."""
 
-from typing import Dict, Any
+import json
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+
+
+# The one definition of a syllabus response: passed to providers that can
+# enforce it, rendered into the prompt for those that cannot, and checked by
+# syllabus_validation. Every object lists all of its keys as required and
+# allows no others, as strict structured output modes demand.
+_STRING_LIST_SCHEMA = {"type": "array", "items": {"type": "string"}}
+
+_LESSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "description": {"type": "string"},
+        "duration_minutes": {"type": "integer"},
+        "learning_objectives": _STRING_LIST_SCHEMA
+    },
+    "required": ["title", "description", "duration_minutes", "learning_objectives"],
+    "additionalProperties": False
+}
+
+_MODULE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "description": {"type": "string"},
+        "order": {"type": "integer"},
+        "lessons": {"type": "array", "items": _LESSON_SCHEMA}
+    },
+    "required": ["title", "description", "order", "lessons"],
+    "additionalProperties": False
+}
+
+_SYLLABUS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "course_title": {"type": "string"},
+        "course_description": {"type": "string"},
+        "target_audience": {"type": "string"},
+        "prerequisites": _STRING_LIST_SCHEMA,
+        "learning_outcomes": _STRING_LIST_SCHEMA,
+        "total_duration_hours": {"type": "number"},
+        "modules": {"type": "array", "items": _MODULE_SCHEMA}
+    },
+    "required": [
+        "course_title",
+        "course_description",
+        "target_audience",
+        "prerequisites",
+        "learning_outcomes",
+        "total_duration_hours",
+        "modules"
+    ],
+    "additionalProperties": False
+}
+
+
+def _render_example(schema: Dict[str, Any], indent: int = 0) -> str:
+    """Render a JSON Schema as the example document shown in the prompt."""
+    pad = " " * indent
+    if schema["type"] == "object":
+        fields = ",\n".join(
+            f'{pad}  "{name}": {_render_example(field, indent + 2)}'
+            for name, field in schema["properties"].items()
+        )
+        return f"{{\n{fields}\n{pad}}}"
+    if schema["type"] == "array":
+        item = _render_example(schema["items"], indent + 2)
+        if schema["items"]["type"] == "object":
+            return f"[\n{pad}  {item}\n{pad}]"
+        return f"[{item}]"
+    return '"string"' if schema["type"] == "string" else "number"
+
+
+# Requirements and JSON schema shared by every syllabus request, joined once
+# at import time
+_STATIC_TAIL = "\n".join([
+    "## Requirements:",
+    "",
+    "1. Create a well-structured syllabus with 4-8 modules",
+    "2. Each module should have 3-6 lessons",
+    "3. Include clear learning objectives for each lesson",
+    "4. Provide estimated duration for each lesson (in minutes)",
+    "5. Include course description, target audience, prerequisites, and overall learning outcomes",
+    "6. Ensure logical progression from basic to advanced concepts",
+    "7. Make the content engaging and appropriate for the specified audience",
+    "",
+    "## JSON Schema:",
+    "",
+    "Respond with a JSON object following this exact structure:",
+    "",
+    "```json",
+    _render_example(_SYLLABUS_SCHEMA),
+    "```",
+    "",
+    "Provide ONLY the JSON response, no additional text or markdown formatting."
+])
 
 
 class SyllabusPromptBuilder:
@@ -12,87 +110,161 @@ and engaging for learners. You should consider learning theory, proper pacing, a
 
 Always respond with valid JSON following the exact schema provided."""
     
+    STATIC_PREFIX = f"{SYSTEM_PROMPT}\n\n{_STATIC_TAIL}"
+    
     @staticmethod
-    def build_syllabus_prompt(course_input: Dict[str, Any]) -> str:
+    def build_static_prefix() -> str:
+        """
+        Get the part of the prompt that is identical for every request.
+        
+        Contains the system instructions, requirements and JSON schema. It is
+        sent first and never contains user input, so providers can reuse
+        their cached processing of it across requests. It is joined once,
+        at import time.
+        
+        Returns:
+            Static prompt prefix
         """
-        Build a detailed prompt for syllabus generation.
+        return SyllabusPromptBuilder.STATIC_PREFIX
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def build_variable_suffix(
+        topic: str,
+        complexity: Optional[str] = None,
+        age_group: Optional[str] = None,
+        tone: Optional[str] = None
+    ) -> str:
+        """
+        Build the request-specific part of the prompt.
+        
+        Results are memoized, so repeated inputs (e.g. the same course sent
+        to several providers) reuse the identical string.
         
         Args:
-            course_input: Dictionary containing topic, complexity, age_group, and tone
+            topic: Course topic or subject
+            complexity: Optional complexity level
+            age_group: Optional target age group
+            tone: Optional tone or style
             
         Returns:
             Formatted prompt string
         """
-        topic = course_input.get("topic", "")
-        complexity = course_input.get("complexity")
-        age_group = course_input.get("age_group")
-        tone = course_input.get("tone")
-        
-        # Build the base prompt
-        prompt_parts = [
-            f"Create a comprehensive course syllabus for the topic: **{topic}**",
-            ""
-        ]
+        head = f"Create a comprehensive course syllabus for the topic: **{topic}**"
         
         # Add optional parameters
-        if complexity:
-            prompt_parts.append(f"- **Complexity Level**: {complexity}")
+        options = "".join([
+            f"\n- **Complexity Level**: {complexity}" if complexity else "",
+            f"\n- **Target Age Group**: {age_group}" if age_group else "",
+            f"\n- **Tone/Style**: {tone}" if tone else ""
+        ])
         
-        if age_group:
-            prompt_parts.append(f"- **Target Age Group**: {age_group}")
+        return f"{head}\n{options}" if options else head
+    
+    @staticmethod
+    def build_batch_prompt(course_inputs: List[Dict[str, Any]]) -> str:
+        """
+        Build a request for several syllabi, to follow the static prefix.
         
-        if tone:
-            prompt_parts.append(f"- **Tone/Style**: {tone}")
+        Args:
+            course_inputs: Dictionaries containing topic, complexity, age_group, and tone
+            
+        Returns:
+            Formatted prompt string
+        """
+        prompt_parts = [
+            f"Create a comprehensive course syllabus for each of the following "
+            f"{len(course_inputs)} topics:",
+            ""
+        ]
         
-        if complexity or age_group or tone:
-            prompt_parts.append("")
+        for idx, course_input in enumerate(course_inputs, 1):
+            details = [f"**{course_input.get('topic', '')}**"]
+            
+            if course_input.get("complexity"):
+                details.append(f"Complexity Level: {course_input['complexity']}")
+            
+            if course_input.get("age_group"):
+                details.append(f"Target Age Group: {course_input['age_group']}")
+            
+            if course_input.get("tone"):
+                details.append(f"Tone/Style: {course_input['tone']}")
+            
+            prompt_parts.append(f"{idx}) " + "; ".join(details))
         
-        # Add detailed requirements
         prompt_parts.extend([
-            "## Requirements:",
             "",
-            "1. Create a well-structured syllabus with 4-8 modules",
-            "2. Each module should have 3-6 lessons",
-            "3. Include clear learning objectives for each lesson",
-            "4. Provide estimated duration for each lesson (in minutes)",
-            "5. Include course description, target audience, prerequisites, and overall learning outcomes",
-            "6. Ensure logical progression from basic to advanced concepts",
-            "7. Make the content engaging and appropriate for the specified audience",
+            'Respond with a JSON object of the form {"syllabi": [...]}, containing '
+            "one syllabus object with the structure above per topic, in the same "
+            "order as listed."
+        ])
+        
+        return "\n".join(prompt_parts)
+    
+    @staticmethod
+    def build_merge_prompt(request: str, syllabi: List[Dict[str, Any]]) -> str:
+        """
+        Build a request to compose a syllabus from existing ones, to follow the static prefix.
+        
+        Args:
+            request: Request-specific prompt from build_variable_suffix()
+            syllabi: Previously generated syllabi covering parts of the request
+            
+        Returns:
+            Formatted prompt string
+        """
+        prompt_parts = [
+            request,
             "",
-            "## JSON Schema:",
+            "Build it by merging the modules of these related syllabi: remove "
+            "duplicates, fill any gaps, and order everything into one coherent "
+            "progression. Write the course details for the new course.",
+            ""
+        ]
+        
+        for syllabus in syllabi:
+            prompt_parts.append(
+                f"### {syllabus.get('course_title', '')}\n"
+                + json.dumps(syllabus.get("modules", []), ensure_ascii=False)
+            )
+        
+        return "\n".join(prompt_parts)
+    
+    @staticmethod
+    def build_repair_prompt(content: str, error: str) -> str:
+        """
+        Build a request to fix an invalid syllabus response, to follow the static prefix.
+        
+        Args:
+            content: Raw response text that failed to parse or validate
+            error: Description of the problem
+            
+        Returns:
+            Formatted prompt string
+        """
+        return "\n".join([
+            "The following response should be a course syllabus matching the "
+            "JSON schema above, but it is invalid.",
             "",
-            "Respond with a JSON object following this exact structure:",
+            f"Error: {error}",
             "",
-            "```json",
-            "{",
-            '  "course_title": "string",',
-            '  "course_description": "string",',
-            '  "target_audience": "string",',
-            '  "prerequisites": ["string"],',
-            '  "learning_outcomes": ["string"],',
-            '  "total_duration_hours": number,',
-            '  "modules": [',
-            "    {",
-            '      "title": "string",',
-            '      "description": "string",',
-            '      "order": number,',
-            '      "lessons": [',
-            "        {",
-            '          "title": "string",',
-            '          "description": "string",',
-            '          "duration_minutes": number,',
-            '          "learning_objectives": ["string"]',
-            "        }",
-            "      ]",
-            "    }",
-            "  ]",
-            "}",
-            "```",
+            content,
             "",
-            "Provide ONLY the JSON response, no additional text or markdown formatting."
+            "Fix this JSON to match the schema, keeping the existing content and "
+            "completing anything that was cut off. Return ONLY the JSON."
         ])
+    
+    @staticmethod
+    def get_json_schema() -> Dict[str, Any]:
+        """
+        Get the JSON Schema of a syllabus response.
         
-        return "\n".join(prompt_parts)
+        The returned dictionary is shared; callers must not modify it.
+        
+        Returns:
+            JSON Schema matching the structure described in the prompt
+        """
+        return _SYLLABUS_SCHEMA
     
     @staticmethod
     def get_system_prompt() -> str:
@@ -1,13 +1,30 @@
 """AI provider implementations."""
 
-from .base_provider import BaseAIProvider
-from .openai_provider import OpenAIProvider
-from .gemini_provider import GeminiProvider
+from importlib import import_module
+
+from .base_provider import BaseAIProvider, SyllabusFormatError
 from .provider_factory import ProviderFactory
 
 __all__ = [
     "BaseAIProvider",
-    "OpenAIProvider", 
+    "SyllabusFormatError",
+    "OpenAIProvider",
     "GeminiProvider",
     "ProviderFactory"
 ]
+
+# Provider classes are imported on first access so that importing the
+# package does not load every provider module
+_LAZY_PROVIDERS = {
+    "OpenAIProvider": ".openai_provider",
+    "GeminiProvider": ".gemini_provider"
+}
+
+
+def __getattr__(name: str):
+    """Import provider classes on first attribute access (PEP 562)."""
+    if name in _LAZY_PROVIDERS:
+        provider_class = getattr(import_module(_LAZY_PROVIDERS[name], __name__), name)
+        globals()[name] = provider_class
+        return provider_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
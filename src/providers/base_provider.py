@@ -1,12 +1,33 @@
 """Base AI provider interface."""
 
+import asyncio
+import json
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional, Union
+
+
+class SyllabusFormatError(ValueError):
+    """Raised when a response is not a valid syllabus JSON document."""
+    
+    def __init__(self, message: str, content: str):
+        """
+        Initialize the error.
+        
+        Args:
+            message: Description of the problem
+            content: Raw response text, kept so the response can be repaired
+        """
+        super().__init__(message)
+        self.content = content
 
 
 class BaseAIProvider(ABC):
     """Abstract base class for AI providers."""
     
+    # Maximum completion tokens per model name prefix; the longest matching
+    # prefix wins. Subclasses fill this in for the models they know.
+    OUTPUT_TOKEN_LIMITS: Dict[str, int] = {}
+    
     def __init__(self, api_key: str):
         """
         Initialize the provider with API key.
@@ -20,7 +41,10 @@ class BaseAIProvider(ABC):
     def generate_syllabus(
         self, 
         system_prompt: str, 
-        user_prompt: str
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        response_schema: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate a syllabus using the AI provider.
@@ -28,15 +52,256 @@ class BaseAIProvider(ABC):
         Args:
             system_prompt: System-level instructions for the AI
             user_prompt: User's specific request
+            temperature: Optional sampling temperature override
+            max_output_tokens: Optional cap on generated tokens
+            response_schema: Optional JSON Schema to enforce, if the model supports it
             
         Returns:
             Dictionary containing the generated syllabus data
             
         Raises:
+            SyllabusFormatError: If the response is not valid JSON
             Exception: If generation fails
         """
         pass
     
+    async def agenerate_syllabus(
+        self, 
+        system_prompt: str, 
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate a syllabus without blocking the event loop.
+        
+        Providers without a native async client run generate_syllabus()
+        in a worker thread.
+        
+        Args:
+            system_prompt: System-level instructions for the AI
+            user_prompt: User's specific request
+            temperature: Optional sampling temperature override
+            max_output_tokens: Optional cap on generated tokens
+            response_schema: Optional JSON Schema to enforce, if the model supports it
+            
+        Returns:
+            Dictionary containing the generated syllabus data
+            
+        Raises:
+            Exception: If generation fails
+        """
+        return await asyncio.to_thread(
+            self.generate_syllabus,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            response_schema=response_schema
+        )
+    
+    def generate_syllabus_stream(
+        self, 
+        system_prompt: str, 
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Generate a syllabus, yielding the JSON response text as it arrives.
+        
+        Providers without streaming support yield the whole response at once.
+        
+        Args:
+            system_prompt: System-level instructions for the AI
+            user_prompt: User's specific request
+            temperature: Optional sampling temperature override
+            max_output_tokens: Optional cap on generated tokens
+            response_schema: Optional JSON Schema to enforce, if the model supports it
+            
+        Yields:
+            Consecutive chunks of the JSON response
+            
+        Raises:
+            Exception: If generation fails
+        """
+        yield json.dumps(self.generate_syllabus(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            response_schema=response_schema
+        ))
+    
+    def generate_syllabi(
+        self, 
+        system_prompt: str, 
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate several syllabi from a single batched request.
+        
+        The user prompt must ask for a JSON object of the form
+        ``{"syllabi": [...]}``.
+        
+        Args:
+            system_prompt: System-level instructions for the AI
+            user_prompt: Batched request for several syllabi
+            temperature: Optional sampling temperature override
+            max_output_tokens: Optional cap on generated tokens
+            response_schema: Optional JSON Schema to enforce, if the model supports it
+            
+        Returns:
+            List of dictionaries containing the generated syllabus data
+            
+        Raises:
+            ValueError: If the response does not contain a list of syllabi
+        """
+        if response_schema is not None:
+            # The schema describes one syllabus; the response holds a list
+            response_schema = {
+                "type": "object",
+                "properties": {
+                    "syllabi": {"type": "array", "items": response_schema}
+                },
+                "required": ["syllabi"],
+                "additionalProperties": False
+            }
+        
+        response = self.generate_syllabus(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            response_schema=response_schema
+        )
+        
+        syllabi = response.get("syllabi")
+        if not isinstance(syllabi, list):
+            raise ValueError("Batch response is missing the 'syllabi' list")
+        
+        return syllabi
+    
+    def generate_syllabi_offline(
+        self, 
+        requests: List[Dict[str, Any]],
+        poll_interval: float = 30.0
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Run several generations through an offline batch API.
+        
+        Providers without a batch API run the requests one after another.
+        
+        Args:
+            requests: Keyword arguments for generate_syllabus(), one dict
+                per request
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            For each request, in order, the generated syllabus data or the
+            exception raised for it
+        """
+        results = []
+        for request in requests:
+            try:
+                results.append(self.generate_syllabus(**request))
+            except Exception as e:
+                results.append(e)
+        return results
+    
+    def output_token_limit(self) -> Optional[int]:
+        """
+        Get the most tokens the model can generate in one response.
+        
+        Returns:
+            Completion token limit, or None if the model is not known
+        """
+        model = getattr(self, "model", "").removeprefix("models/")
+        prefixes = [prefix for prefix in self.OUTPUT_TOKEN_LIMITS if model.startswith(prefix)]
+        if not prefixes:
+            return None
+        return self.OUTPUT_TOKEN_LIMITS[max(prefixes, key=len)]
+    
+    def supports_response_schema(self) -> bool:
+        """
+        Check whether the model can enforce a response_schema.
+        
+        Providers ignore the schema for models that cannot, relying on
+        plain JSON mode instead.
+        
+        Returns:
+            True if a response_schema is enforced during generation
+        """
+        return False
+    
+    def warmup(self) -> None:
+        """
+        Prepare the provider for its first request.
+        
+        Loads the SDK, builds the client and opens a connection with a
+        cheap authenticated request (validate_api_key() by default), so
+        that a later generation does not pay for them. Failures are ignored;
+        the real request reports them.
+        """
+        try:
+            self.validate_api_key()
+        except Exception:
+            pass
+    
+    def is_outage_error(self, error: BaseException) -> bool:
+        """
+        Check whether an error means the provider is unavailable.
+        
+        Providers re-raise SDK errors with the original as the cause, so
+        the error and its causes are checked against _transient_errors().
+        Anything else (a rejected request, a bad key, a malformed response)
+        shows the provider is up.
+        
+        Args:
+            error: Exception raised by a provider call
+            
+        Returns:
+            True if the error is a connection failure, rate limit or
+            server error
+        """
+        try:
+            transient = self._transient_errors()
+        except ImportError:
+            return False
+        
+        while error is not None:
+            if isinstance(error, transient):
+                return True
+            error = error.__cause__
+        return False
+    
+    @staticmethod
+    def _transient_errors() -> tuple:
+        """Get the error types worth retrying."""
+        return (ConnectionError, TimeoutError)
+    
+    def embed_text(self, text: str) -> List[float]:
+        """
+        Compute an embedding vector for a short text.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Embedding vector
+            
+        Raises:
+            NotImplementedError: If the provider does not support embeddings
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support embeddings"
+        )
+    
     @abstractmethod
     def validate_api_key(self) -> bool:
         """
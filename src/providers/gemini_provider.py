@@ -1,13 +1,75 @@
 """Google Gemini provider implementation."""
 
 import json
-from typing import Dict, Any
-from .base_provider import BaseAIProvider
+import threading
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple, TypeVar
+from .base_provider import BaseAIProvider, SyllabusFormatError
+from .retry import aretry_call, retry_call
+from ..utils.json_utils import loads as json_loads
+
+T = TypeVar("T")
+
+
+# genai.configure() replaces module-wide state and rebuilds the API client,
+# so it is only called when the key changes, and configured models are
+# shared between provider instances with the same key and model
+_GEMINI_MODEL_CACHE: Dict[Tuple[str, str], Any] = {}
+_gemini_state_lock = threading.Lock()
+_configured_api_key: Optional[str] = None
+
+
+# Models that predate controlled generation and reject response_schema
+_NO_RESPONSE_SCHEMA_MODELS = ("gemini-pro", "gemini-1.0")
+
+
+def _configure(genai, api_key: str) -> None:
+    """Point genai at api_key, unless it already is. Call with the lock held."""
+    global _configured_api_key
+    
+    if _configured_api_key != api_key:
+        genai.configure(api_key=api_key)
+        _configured_api_key = api_key
+
+
+def _to_gemini_schema(schema: Any) -> Any:
+    """
+    Convert a JSON Schema into the OpenAPI subset Gemini accepts.
+    
+    Gemini rejects additionalProperties and expects upper-case type names.
+    """
+    if isinstance(schema, list):
+        return [_to_gemini_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    
+    converted = {}
+    for key, value in schema.items():
+        if key == "additionalProperties":
+            continue
+        if key == "type" and isinstance(value, str):
+            converted[key] = value.upper()
+        elif key == "properties":
+            converted[key] = {
+                name: _to_gemini_schema(prop) for name, prop in value.items()
+            }
+        else:
+            converted[key] = _to_gemini_schema(value)
+    return converted
 
 
 class GeminiProvider(BaseAIProvider):
     """Google Gemini API provider for syllabus generation."""
     
+    EMBEDDING_MODEL = "models/text-embedding-004"
+    
+    OUTPUT_TOKEN_LIMITS = {
+        "gemini-pro": 2048,
+        "gemini-1.0": 2048,
+        "gemini-1.5": 8192,
+        "gemini-2.0": 8192,
+        "gemini-2.5": 65536
+    }
+    
     def __init__(self, api_key: str, model: str = "gemini-1.5-flash"):
         """
         Initialize Gemini provider.
@@ -20,31 +82,88 @@ class GeminiProvider(BaseAIProvider):
         self.model = model
         self._client = None
     
+    @staticmethod
+    def _import_genai():
+        """Import the Gemini SDK, explaining how to install it if missing."""
+        try:
+            import google.generativeai as genai
+        except ImportError:
+            raise ImportError(
+                "Google Generative AI package not installed. "
+                "Install it with: pip install google-generativeai"
+            )
+        return genai
+    
     def _get_client(self):
         """Lazy load the Gemini client."""
         if self._client is None:
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=self.api_key)
-                self._client = genai.GenerativeModel(
-                    model_name=self.model,
-                    generation_config={
-                        "temperature": 0.7,
-                        "max_output_tokens": 8192,
-                        "response_mime_type": "application/json"
-                    }
-                )
-            except ImportError:
-                raise ImportError(
-                    "Google Generative AI package not installed. "
-                    "Install it with: pip install google-generativeai"
-                )
+            genai = self._import_genai()
+            from google.generativeai import client as genai_client
+            
+            with _gemini_state_lock:
+                _configure(genai, self.api_key)
+                
+                key = (self.api_key, self.model)
+                client = _GEMINI_MODEL_CACHE.get(key)
+                if client is None:
+                    client = genai.GenerativeModel(
+                        model_name=self.model,
+                        generation_config={
+                            "temperature": 0.7,
+                            "max_output_tokens": 8192,
+                            "response_mime_type": "application/json"
+                        }
+                    )
+                    # GenerativeModel otherwise picks up the API client on
+                    # its first request, under whichever key is configured
+                    # by then; bind it now, while this key is
+                    client._client = genai_client.get_default_generative_client()
+                    _GEMINI_MODEL_CACHE[key] = client
+            
+            self._client = client
         return self._client
     
+    def _get_async_client(self):
+        """
+        Get the Gemini client with its async API client bound to this key.
+        
+        The async API client is created separately, and only inside the
+        event loop it will run on, so it is bound on first async use.
+        """
+        client = self._get_client()
+        
+        if client._async_client is None:
+            genai = self._import_genai()
+            from google.generativeai import client as genai_client
+            
+            with _gemini_state_lock:
+                _configure(genai, self.api_key)
+                if client._async_client is None:
+                    client._async_client = genai_client.get_default_generative_async_client()
+        
+        return client
+    
+    def _call_with_key(self, func: Callable[[], T]) -> T:
+        """
+        Call a module-level genai function with this provider's API key.
+        
+        The key is module-wide state, so another provider instance may have
+        switched it since this one was set up; the lock keeps it from
+        changing again until the call returns.
+        """
+        genai = self._import_genai()
+        
+        with _gemini_state_lock:
+            _configure(genai, self.api_key)
+            return func()
+    
     def generate_syllabus(
         self, 
         system_prompt: str, 
-        user_prompt: str
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        response_schema: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate syllabus using Gemini API.
@@ -52,6 +171,9 @@ class GeminiProvider(BaseAIProvider):
         Args:
             system_prompt: System instructions
             user_prompt: User request
+            temperature: Optional sampling temperature override (default: 0.7)
+            max_output_tokens: Optional cap on generated tokens (default: 8192)
+            response_schema: Optional JSON Schema to enforce, if the model supports it
             
         Returns:
             Dictionary with syllabus data
@@ -62,32 +184,211 @@ class GeminiProvider(BaseAIProvider):
         combined_prompt = f"{system_prompt}\n\n{user_prompt}"
         
         try:
-            response = client.generate_content(combined_prompt)
+            generation_config = self._build_generation_config(
+                temperature, max_output_tokens, response_schema
+            )
+            response = retry_call(
+                lambda: client.generate_content(
+                    combined_prompt,
+                    generation_config=generation_config
+                ),
+                retry_on=self._transient_errors()
+            )
             
             # Extract text from response
             content = response.text
             
             # Parse JSON
-            syllabus_data = json.loads(content)
+            syllabus_data = json_loads(content)
+            
+            return syllabus_data
+            
+        except json.JSONDecodeError as e:
+            raise SyllabusFormatError(f"Failed to parse JSON response: {e}", content)
+        except Exception as e:
+            raise Exception(f"Gemini API error: {e}") from e
+    
+    async def agenerate_syllabus(
+        self, 
+        system_prompt: str, 
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate syllabus using Gemini's async API.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User request
+            temperature: Optional sampling temperature override (default: 0.7)
+            max_output_tokens: Optional cap on generated tokens (default: 8192)
+            response_schema: Optional JSON Schema to enforce, if the model supports it
+            
+        Returns:
+            Dictionary with syllabus data
+        """
+        client = self._get_async_client()
+        
+        # Combine system and user prompts for Gemini
+        combined_prompt = f"{system_prompt}\n\n{user_prompt}"
+        
+        try:
+            generation_config = self._build_generation_config(
+                temperature, max_output_tokens, response_schema
+            )
+            response = await aretry_call(
+                lambda: client.generate_content_async(
+                    combined_prompt,
+                    generation_config=generation_config
+                ),
+                retry_on=self._transient_errors()
+            )
+            
+            content = response.text
+            syllabus_data = json_loads(content)
             
             return syllabus_data
             
         except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse JSON response: {e}")
+            raise SyllabusFormatError(f"Failed to parse JSON response: {e}", content)
         except Exception as e:
-            raise Exception(f"Gemini API error: {e}")
+            raise Exception(f"Gemini API error: {e}") from e
+    
+    def generate_syllabus_stream(
+        self, 
+        system_prompt: str, 
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Generate syllabus using Gemini API, streaming the response.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User request
+            temperature: Optional sampling temperature override (default: 0.7)
+            max_output_tokens: Optional cap on generated tokens (default: 8192)
+            response_schema: Optional JSON Schema to enforce, if the model supports it
+            
+        Yields:
+            Consecutive chunks of the JSON response
+        """
+        client = self._get_client()
+        
+        # Combine system and user prompts for Gemini
+        combined_prompt = f"{system_prompt}\n\n{user_prompt}"
+        
+        try:
+            generation_config = self._build_generation_config(
+                temperature, max_output_tokens, response_schema
+            )
+            # Only opening the stream is retried; chunks already yielded
+            # cannot be taken back
+            response = retry_call(
+                lambda: client.generate_content(
+                    combined_prompt,
+                    generation_config=generation_config,
+                    stream=True
+                ),
+                retry_on=self._transient_errors()
+            )
+            
+            for chunk in response:
+                # The final chunk may carry only finish metadata
+                if chunk.parts:
+                    yield chunk.text
+                    
+        except Exception as e:
+            raise Exception(f"Gemini API error: {e}") from e
+    
+    def supports_response_schema(self) -> bool:
+        """Check whether the model accepts a response_schema."""
+        return not self.model.removeprefix("models/").startswith(
+            _NO_RESPONSE_SCHEMA_MODELS
+        )
+    
+    def _build_generation_config(
+        self,
+        temperature: Optional[float],
+        max_output_tokens: Optional[int],
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Build per-call settings, merged over the model's generation_config."""
+        generation_config = {}
+        if temperature is not None:
+            generation_config["temperature"] = temperature
+        if max_output_tokens is not None:
+            generation_config["max_output_tokens"] = max_output_tokens
+        if response_schema is not None and self.supports_response_schema():
+            generation_config["response_schema"] = _to_gemini_schema(response_schema)
+        
+        return generation_config or None
+    
+    def embed_text(self, text: str) -> List[float]:
+        """
+        Compute an embedding vector using the Gemini embeddings API.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Embedding vector
+        """
+        genai = self._import_genai()
+        
+        response = retry_call(
+            lambda: self._call_with_key(
+                lambda: genai.embed_content(model=self.EMBEDDING_MODEL, content=text)
+            ),
+            retry_on=self._transient_errors()
+        )
+        
+        return response["embedding"]
+    
+    @staticmethod
+    def _transient_errors() -> tuple:
+        """Get the Google API error types worth retrying."""
+        from google.api_core import exceptions
+        
+        return (
+            exceptions.ResourceExhausted,
+            exceptions.ServiceUnavailable,
+            exceptions.InternalServerError,
+            exceptions.DeadlineExceeded
+        )
     
     def validate_api_key(self) -> bool:
         """
         Validate Gemini API key.
         
+        Transient failures (rate limits, unavailable or overloaded service)
+        are retried and, if they persist, raised rather than reported as an
+        invalid key.
+        
         Returns:
-            True if valid, False otherwise
+            True if valid, False if the key is rejected
         """
+        genai = self._import_genai()
+        from google.api_core import exceptions
+        
         try:
-            client = self._get_client()
-            # Make a minimal API call to test the key
-            test_response = client.generate_content("Test")
-            return test_response is not None
-        except Exception:
+            # Listing models authenticates without running (and billing)
+            # a generation; fetching the first page is enough
+            retry_call(
+                lambda: self._call_with_key(
+                    lambda: next(iter(genai.list_models()), None)
+                ),
+                retry_on=self._transient_errors()
+            )
+            return True
+        except (
+            exceptions.InvalidArgument,
+            exceptions.PermissionDenied,
+            exceptions.Unauthenticated
+        ):
+            # An invalid key is reported as INVALID_ARGUMENT
             return False
@@ -0,0 +1,46 @@
+"""Shared HTTP connection pool for provider SDKs."""
+
+import atexit
+import threading
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_http_client():
+    """
+    Get the process-wide HTTP client used by provider SDKs.
+    
+    Sharing one client keeps TCP and TLS connections open between requests
+    and across provider instances. HTTP/2 is used when the h2 package is
+    installed. httpx clients are thread-safe. The client is closed when
+    the interpreter exits.
+    
+    Returns:
+        Shared httpx.Client instance
+    """
+    global _shared_client
+    
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                import httpx
+                
+                try:
+                    import h2  # noqa: F401
+                    http2 = True
+                except ImportError:
+                    http2 = False
+                
+                _shared_client = httpx.Client(
+                    http2=http2,
+                    # Long read timeout: large generations can take minutes
+                    timeout=httpx.Timeout(600.0, connect=5.0),
+                    limits=httpx.Limits(
+                        max_keepalive_connections=20,
+                        max_connections=40
+                    )
+                )
+                atexit.register(_shared_client.close)
+    
+    return _shared_client
@@ -1,42 +1,121 @@
 """OpenAI provider implementation."""
 
+import asyncio
 import json
-from typing import Dict, Any
-from .base_provider import BaseAIProvider
+import logging
+import threading
+import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+from .base_provider import BaseAIProvider, SyllabusFormatError
+from .http_client import get_shared_http_client
+from .retry import aretry_call, retry_call
+from ..utils.json_utils import loads as json_loads
+
+
+logger = logging.getLogger(__name__)
+
+# Sync clients are thread-safe and hold no per-request state, so provider
+# instances with the same key and HTTP client share one
+_OPENAI_CLIENT_CACHE: Dict[Tuple[str, Any], Any] = {}
+_openai_client_lock = threading.Lock()
+
+# Model families that accept a strict json_schema response_format; older
+# models (gpt-4-turbo, gpt-3.5-turbo, ...) reject it and use JSON mode
+_STRUCTURED_OUTPUT_MODELS = ("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")
+_NO_STRUCTURED_OUTPUT_MODELS = ("gpt-4o-2024-05-13", "o1-mini", "o1-preview")
 
 
 class OpenAIProvider(BaseAIProvider):
     """OpenAI API provider for syllabus generation."""
     
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    EMBEDDING_MODEL = "text-embedding-3-small"
+    
+    OUTPUT_TOKEN_LIMITS = {
+        "gpt-3.5-turbo": 4096,
+        "gpt-4": 8192,
+        "gpt-4-": 4096,
+        "gpt-4o": 16384,
+        "gpt-4o-2024-05-13": 4096,
+        "gpt-4.1": 32768
+    }
+    
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        http_client: Optional[Any] = None
+    ):
         """
         Initialize OpenAI provider.
         
         Args:
             api_key: OpenAI API key
             model: Model to use (default: gpt-4o-mini)
+            http_client: Optional httpx.Client to send requests through
+                (default: the process-wide shared client)
         """
         super().__init__(api_key)
         self.model = model
+        self.http_client = http_client
         self._client = None
+        self._async_client = None
+        self._async_client_loop = None
     
     def _get_client(self):
         """Lazy load the OpenAI client."""
         if self._client is None:
             try:
                 from openai import OpenAI
-                self._client = OpenAI(api_key=self.api_key)
             except ImportError:
                 raise ImportError(
                     "OpenAI package not installed. "
                     "Install it with: pip install openai"
                 )
+            
+            http_client = self.http_client or get_shared_http_client()
+            
+            with _openai_client_lock:
+                key = (self.api_key, http_client)
+                client = _OPENAI_CLIENT_CACHE.get(key)
+                if client is None:
+                    # Retries are handled by retry_call so they are not compounded
+                    client = OpenAI(
+                        api_key=self.api_key,
+                        http_client=http_client,
+                        max_retries=0
+                    )
+                    _OPENAI_CLIENT_CACHE[key] = client
+            
+            self._client = client
         return self._client
     
+    def _get_async_client(self):
+        """Lazy load the async OpenAI client for the running event loop."""
+        # Async connections belong to the loop that opened them, so a new
+        # loop (e.g. a later asyncio.run) needs its own client
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            try:
+                from openai import AsyncOpenAI
+                self._async_client = AsyncOpenAI(
+                    api_key=self.api_key,
+                    max_retries=0
+                )
+                self._async_client_loop = loop
+            except ImportError:
+                raise ImportError(
+                    "OpenAI package not installed. "
+                    "Install it with: pip install openai"
+                )
+        return self._async_client
+    
     def generate_syllabus(
         self, 
         system_prompt: str, 
-        user_prompt: str
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        response_schema: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate syllabus using OpenAI API.
@@ -44,6 +123,9 @@ class OpenAIProvider(BaseAIProvider):
         Args:
             system_prompt: System instructions
             user_prompt: User request
+            temperature: Optional sampling temperature override (default: 0.7)
+            max_output_tokens: Optional cap on generated tokens (default: 4000)
+            response_schema: Optional JSON Schema to enforce, if the model supports it
             
         Returns:
             Dictionary with syllabus data
@@ -51,38 +133,338 @@ class OpenAIProvider(BaseAIProvider):
         client = self._get_client()
         
         try:
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.7,
-                max_tokens=4000
+            request = self._build_request(
+                system_prompt, user_prompt, temperature, max_output_tokens, response_schema
+            )
+            response = retry_call(
+                lambda: client.chat.completions.create(**request),
+                retry_on=self._transient_errors()
             )
             
+            self._log_prompt_cache_usage(response)
             content = response.choices[0].message.content
-            syllabus_data = json.loads(content)
+            syllabus_data = json_loads(content)
             
             return syllabus_data
             
         except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse JSON response: {e}")
+            raise SyllabusFormatError(f"Failed to parse JSON response: {e}", content)
         except Exception as e:
-            raise Exception(f"OpenAI API error: {e}")
+            raise Exception(f"OpenAI API error: {e}") from e
+    
+    async def agenerate_syllabus(
+        self, 
+        system_prompt: str, 
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate syllabus using the async OpenAI client.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User request
+            temperature: Optional sampling temperature override (default: 0.7)
+            max_output_tokens: Optional cap on generated tokens (default: 4000)
+            response_schema: Optional JSON Schema to enforce, if the model supports it
+            
+        Returns:
+            Dictionary with syllabus data
+        """
+        client = self._get_async_client()
+        
+        try:
+            request = self._build_request(
+                system_prompt, user_prompt, temperature, max_output_tokens, response_schema
+            )
+            response = await aretry_call(
+                lambda: client.chat.completions.create(**request),
+                retry_on=self._transient_errors()
+            )
+            
+            self._log_prompt_cache_usage(response)
+            content = response.choices[0].message.content
+            syllabus_data = json_loads(content)
+            
+            return syllabus_data
+            
+        except json.JSONDecodeError as e:
+            raise SyllabusFormatError(f"Failed to parse JSON response: {e}", content)
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {e}") from e
+    
+    def generate_syllabus_stream(
+        self, 
+        system_prompt: str, 
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Generate syllabus using OpenAI API, streaming the response.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User request
+            temperature: Optional sampling temperature override (default: 0.7)
+            max_output_tokens: Optional cap on generated tokens (default: 4000)
+            response_schema: Optional JSON Schema to enforce, if the model supports it
+            
+        Yields:
+            Consecutive chunks of the JSON response
+        """
+        client = self._get_client()
+        
+        try:
+            request = self._build_request(
+                system_prompt, user_prompt, temperature, max_output_tokens, response_schema
+            )
+            # Only opening the stream is retried; chunks already yielded
+            # cannot be taken back
+            stream = retry_call(
+                lambda: client.chat.completions.create(**request, stream=True),
+                retry_on=self._transient_errors()
+            )
+            
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                    
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {e}") from e
+    
+    def _build_request(
+        self, 
+        system_prompt: str, 
+        user_prompt: str,
+        temperature: Optional[float],
+        max_output_tokens: Optional[int],
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build the chat completion arguments shared by all requests."""
+        messages: List[Dict[str, str]] = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        
+        return {
+            "model": self.model,
+            "messages": messages,
+            "response_format": self._response_format(response_schema),
+            "temperature": 0.7 if temperature is None else temperature,
+            "max_tokens": max_output_tokens or 4000
+        }
+    
+    def supports_response_schema(self) -> bool:
+        """Check whether the model accepts strict structured outputs."""
+        return (
+            self.model.startswith(_STRUCTURED_OUTPUT_MODELS)
+            and not self.model.startswith(_NO_STRUCTURED_OUTPUT_MODELS)
+        )
+    
+    def _response_format(self, response_schema: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the response_format argument.
+        
+        With a schema and a model that supports it, structured outputs in
+        strict mode guarantee that the response matches the schema;
+        otherwise only valid JSON is guaranteed.
+        """
+        if response_schema is None or not self.supports_response_schema():
+            return {"type": "json_object"}
+        
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "syllabus",
+                "schema": response_schema,
+                "strict": True
+            }
+        }
+    
+    def generate_syllabi_offline(
+        self, 
+        requests: List[Dict[str, Any]],
+        poll_interval: float = 30.0
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Run several generations through the OpenAI Batch API.
+        
+        The requests are uploaded as a JSONL file and processed within 24
+        hours at a discount; this call blocks, polling until the batch ends.
+        
+        Args:
+            requests: Keyword arguments for generate_syllabus(), one dict
+                per request
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            For each request, in order, the generated syllabus data or the
+            exception raised for it
+            
+        Raises:
+            Exception: If the batch as a whole fails, expires or is cancelled
+        """
+        client = self._get_client()
+        transient = self._transient_errors()
+        
+        lines = [
+            json.dumps({
+                "custom_id": str(idx),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_request(
+                    request["system_prompt"],
+                    request["user_prompt"],
+                    request.get("temperature"),
+                    request.get("max_output_tokens"),
+                    request.get("response_schema")
+                )
+            })
+            for idx, request in enumerate(requests)
+        ]
+        
+        try:
+            batch_file = retry_call(
+                lambda: client.files.create(
+                    file=("syllabi.jsonl", "\n".join(lines).encode("utf-8")),
+                    purpose="batch"
+                ),
+                retry_on=transient
+            )
+            batch = retry_call(
+                lambda: client.batches.create(
+                    input_file_id=batch_file.id,
+                    endpoint="/v1/chat/completions",
+                    completion_window="24h"
+                ),
+                retry_on=transient
+            )
+            
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                batch_id = batch.id
+                batch = retry_call(
+                    lambda: client.batches.retrieve(batch_id),
+                    retry_on=transient
+                )
+            
+            # Successful requests are written to the output file and failed
+            # ones to the error file, in the same record format
+            output = ""
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if file_id:
+                    output += retry_call(
+                        lambda: client.files.content(file_id),
+                        retry_on=transient
+                    ).text + "\n"
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {e}") from e
+        
+        if batch.status != "completed":
+            raise Exception(f"OpenAI batch {batch.id} ended with status {batch.status}")
+        
+        results: List[Union[Dict[str, Any], Exception]] = [
+            Exception(f"OpenAI batch {batch.id} returned no result for this request")
+            for _ in requests
+        ]
+        
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json_loads(line)
+            idx = int(record["custom_id"])
+            response = record.get("response") or {}
+            
+            if response.get("status_code") != 200:
+                error = record.get("error") or (response.get("body") or {}).get("error")
+                if isinstance(error, dict):
+                    error = error.get("message") or error
+                results[idx] = Exception(f"OpenAI API error: {error}")
+                continue
+            
+            content = response["body"]["choices"][0]["message"]["content"]
+            try:
+                results[idx] = json_loads(content)
+            except json.JSONDecodeError as e:
+                results[idx] = SyllabusFormatError(
+                    f"Failed to parse JSON response: {e}", content
+                )
+        
+        return results
+    
+    def embed_text(self, text: str) -> List[float]:
+        """
+        Compute an embedding vector using the OpenAI embeddings API.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Embedding vector
+        """
+        client = self._get_client()
+        
+        response = retry_call(
+            lambda: client.embeddings.create(model=self.EMBEDDING_MODEL, input=text),
+            retry_on=self._transient_errors()
+        )
+        
+        return response.data[0].embedding
+    
+    @staticmethod
+    def _log_prompt_cache_usage(response: Any) -> None:
+        """
+        Log how much of the prompt was served from OpenAI's prompt cache.
+        
+        OpenAI caches prompt prefixes of 1024 tokens or more automatically;
+        the static prefix is sent first so it can be reused. This makes
+        cache hits visible with debug logging enabled.
+        """
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        
+        if cached_tokens is not None:
+            logger.debug(
+                "OpenAI prompt tokens: %d, served from prompt cache: %d",
+                usage.prompt_tokens,
+                cached_tokens
+            )
+    
+    @staticmethod
+    def _transient_errors() -> tuple:
+        """Get the OpenAI error types worth retrying."""
+        import openai
+        
+        # APITimeoutError is a subclass of APIConnectionError
+        return (
+            openai.APIConnectionError,
+            openai.RateLimitError,
+            openai.InternalServerError
+        )
     
     def validate_api_key(self) -> bool:
         """
         Validate OpenAI API key.
         
+        Transient failures (network errors, rate limits, 5xx responses) are
+        retried and, if they persist, raised rather than reported as an
+        invalid key.
+        
         Returns:
-            True if valid, False otherwise
+            True if valid, False if the key is rejected
         """
+        client = self._get_client()
+        
+        from openai import AuthenticationError
+        
         try:
-            client = self._get_client()
             # Make a minimal API call to test the key
-            client.models.list()
+            retry_call(client.models.list, retry_on=self._transient_errors())
             return True
-        except Exception:
+        except AuthenticationError:
             return False
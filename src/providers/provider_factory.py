@@ -1,24 +1,31 @@
 """Factory for creating AI providers."""
 
-from typing import Optional
+from functools import cache
+from importlib import import_module
+from typing import Any, Optional, Type
 from .base_provider import BaseAIProvider
-from .openai_provider import OpenAIProvider
-from .gemini_provider import GeminiProvider
 
 
 class ProviderFactory:
     """Factory for creating AI provider instances."""
     
+    # Provider name -> (module, class name). Only the selected provider's
+    # module is imported, when it is created
     SUPPORTED_PROVIDERS = {
-        "openai": OpenAIProvider,
-        "gemini": GeminiProvider
+        "openai": (".openai_provider", "OpenAIProvider"),
+        "gemini": (".gemini_provider", "GeminiProvider")
     }
     
+    # Providers whose SDK talks HTTP through an injectable httpx client;
+    # the Gemini SDK uses gRPC and manages its own channel
+    HTTP_CLIENT_PROVIDERS = {"openai"}
+    
     @staticmethod
     def create_provider(
         provider_name: str, 
         api_key: str,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        http_client: Optional[Any] = None
     ) -> BaseAIProvider:
         """
         Create an AI provider instance.
@@ -27,12 +34,16 @@ class ProviderFactory:
             provider_name: Name of the provider ('openai' or 'gemini')
             api_key: API key for the provider
             model: Optional model name override
-            
+            http_client: Optional httpx.Client for providers that send
+                requests over HTTP (OpenAI); by default they share one
+                process-wide client
+                
         Returns:
             Instance of the requested provider
             
         Raises:
-            ValueError: If provider name is not supported
+            ValueError: If provider name is not supported, or http_client
+                is given for a provider that cannot use it
         """
         provider_name = provider_name.lower()
         
@@ -43,12 +54,37 @@ class ProviderFactory:
                 f"Supported providers: {supported}"
             )
         
-        provider_class = ProviderFactory.SUPPORTED_PROVIDERS[provider_name]
+        provider_class = ProviderFactory.get_provider_class(provider_name)
         
+        kwargs = {"api_key": api_key}
         if model:
-            return provider_class(api_key=api_key, model=model)
-        else:
-            return provider_class(api_key=api_key)
+            kwargs["model"] = model
+        if http_client is not None:
+            if provider_name not in ProviderFactory.HTTP_CLIENT_PROVIDERS:
+                raise ValueError(
+                    f"Provider {provider_name} does not accept an HTTP client"
+                )
+            kwargs["http_client"] = http_client
+        
+        return provider_class(**kwargs)
+    
+    @staticmethod
+    @cache
+    def get_provider_class(provider_name: str) -> Type[BaseAIProvider]:
+        """
+        Import and return the class for a supported provider.
+        
+        The result is memoized, so repeated lookups skip the import
+        machinery.
+        
+        Args:
+            provider_name: Name of the provider ('openai' or 'gemini')
+            
+        Returns:
+            Provider class
+        """
+        module_name, class_name = ProviderFactory.SUPPORTED_PROVIDERS[provider_name]
+        return getattr(import_module(module_name, __package__), class_name)
     
     @staticmethod
     def get_supported_providers() -> list:
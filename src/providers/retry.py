@@ -0,0 +1,89 @@
+"""Retry helpers for transient provider errors."""
+
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_ATTEMPTS = 4
+DEFAULT_INITIAL_DELAY = 1.0
+DEFAULT_MAX_DELAY = 30.0
+
+
+def backoff_delay(
+    attempt: int,
+    initial_delay: float = DEFAULT_INITIAL_DELAY,
+    max_delay: float = DEFAULT_MAX_DELAY
+) -> float:
+    """
+    Get the wait before retrying, using exponential backoff with jitter.
+    
+    Args:
+        attempt: Number of the attempt that just failed, starting at 0
+        initial_delay: Delay after the first failure, in seconds
+        max_delay: Upper bound on the delay, in seconds
+        
+    Returns:
+        Delay in seconds
+    """
+    return min(max_delay, initial_delay * 2 ** attempt + random.uniform(0, 1))
+
+
+def retry_call(
+    func: Callable[[], T],
+    retry_on: Tuple[Type[BaseException], ...],
+    attempts: int = DEFAULT_ATTEMPTS
+) -> T:
+    """
+    Call a function, retrying transient failures with backoff.
+    
+    Args:
+        func: Function to call
+        retry_on: Exception types that indicate a transient failure
+        attempts: Maximum number of calls
+        
+    Returns:
+        The function's return value
+        
+    Raises:
+        Exception: The last error once attempts are exhausted, or any
+            error not listed in retry_on
+    """
+    for attempt in range(attempts):
+        try:
+            return func()
+        except retry_on:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(backoff_delay(attempt))
+
+
+async def aretry_call(
+    func: Callable[[], Awaitable[T]],
+    retry_on: Tuple[Type[BaseException], ...],
+    attempts: int = DEFAULT_ATTEMPTS
+) -> T:
+    """
+    Await a coroutine function, retrying transient failures with backoff.
+    
+    Args:
+        func: Function returning a new awaitable on each call
+        retry_on: Exception types that indicate a transient failure
+        attempts: Maximum number of calls
+        
+    Returns:
+        The awaited result
+        
+    Raises:
+        Exception: The last error once attempts are exhausted, or any
+            error not listed in retry_on
+    """
+    for attempt in range(attempts):
+        try:
+            return await func()
+        except retry_on:
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep(backoff_delay(attempt))
@@ -1,5 +1,16 @@
 """Service layer for business logic."""
 
+from .cache import DiskCache, MemoryCache, SemanticCache
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
 from .syllabus_service import SyllabusService
+from .syllabus_store import SyllabusStore
 
-__all__ = ["SyllabusService"]
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "DiskCache",
+    "MemoryCache",
+    "SemanticCache",
+    "SyllabusService",
+    "SyllabusStore"
+]
@@ -0,0 +1,424 @@
+"""Response caching for syllabus generation."""
+
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+
+from ..models.course_input import CourseInput
+from ..providers.base_provider import BaseAIProvider
+from ..utils.json_utils import loads as json_loads
+
+
+DEFAULT_CACHE_DIR = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "ai-course-creator"
+)
+DEFAULT_EXPIRE_SECONDS = 7 * 86400
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+DEFAULT_MEMORY_CACHE_SIZE = 256
+
+
+class ResponseCache(Protocol):
+    """Interface of exact-match caches accepted by SyllabusService."""
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for key, or None on a miss."""
+        ...
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a value under key."""
+        ...
+
+
+def make_cache_key(
+    course_input: CourseInput,
+    ai_provider: BaseAIProvider,
+    system_prompt: str,
+    user_prompt: str
+) -> str:
+    """
+    Build a stable cache key for a generation request.
+    
+    Args:
+        course_input: User's course requirements
+        ai_provider: Provider that would serve the request
+        system_prompt: System prompt sent to the provider
+        user_prompt: User prompt sent to the provider
+        
+    Returns:
+        Hex digest identifying the request
+    """
+    prompt_hash = hashlib.blake2b(
+        f"{system_prompt}\x00{user_prompt}".encode("utf-8"),
+        digest_size=16
+    ).hexdigest()
+    
+    # Serialized on first use and memoized per input (see to_canonical_json)
+    hasher = hashlib.blake2b(course_input.to_canonical_json())
+    hasher.update(
+        json.dumps(
+            [type(ai_provider).__name__, getattr(ai_provider, "model", ""), prompt_hash]
+        ).encode("utf-8")
+    )
+    
+    return hasher.hexdigest()
+
+
+def make_semantic_scope(
+    course_input: CourseInput,
+    ai_provider: BaseAIProvider,
+    system_prompt: str
+) -> str:
+    """
+    Build the key that semantically similar requests must share exactly.
+    
+    Only the topic is compared by similarity; the remaining options, the
+    provider and the instructions have to match for a cached syllabus to
+    be reused.
+    
+    Args:
+        course_input: User's course requirements
+        ai_provider: Provider that would serve the request
+        system_prompt: System prompt sent to the provider
+        
+    Returns:
+        Hex digest identifying the scope
+    """
+    payload = json.dumps(
+        {
+            "complexity": course_input.complexity,
+            "age_group": course_input.age_group,
+            "tone": course_input.tone,
+            "provider": type(ai_provider).__name__,
+            "model": getattr(ai_provider, "model", ""),
+            "system_prompt": system_prompt
+        },
+        sort_keys=True
+    )
+    
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """
+    Write JSON to a file so that readers never see a partial document.
+    
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temp file and rename over the target
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+class DiskCache:
+    """File-backed cache storing raw syllabus data as JSON, one file per key."""
+    
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        expire: Optional[float] = DEFAULT_EXPIRE_SECONDS
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            directory: Directory for cache entries (default: ~/.cache/ai-course-creator)
+            expire: Default entry lifetime in seconds, or None to never expire
+        """
+        self.directory = Path(directory) if directory else DEFAULT_CACHE_DIR
+        self.expire = expire
+    
+    def _path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.directory / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached value.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value, or None on a miss or expired entry
+        """
+        path = self._path(key)
+        
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at < time.time():
+            path.unlink(missing_ok=True)
+            return None
+        
+        return entry.get("value")
+    
+    def set(
+        self,
+        key: str,
+        value: Dict[str, Any],
+        expire: Optional[float] = None
+    ) -> None:
+        """
+        Store a value in the cache.
+        
+        Caching is best-effort: write failures are ignored so that a
+        read-only or full disk never breaks generation.
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value to store
+            expire: Entry lifetime in seconds (defaults to the cache's expire)
+        """
+        expire = self.expire if expire is None else expire
+        entry = {
+            "expires_at": time.time() + expire if expire else None,
+            "value": value
+        }
+        
+        try:
+            _write_json_atomic(self._path(key), entry)
+        except OSError:
+            pass
+
+
+class MemoryCache:
+    """
+    In-process LRU cache storing raw syllabus data as JSON strings.
+    
+    Useful for long-running processes and batch jobs that repeat requests
+    without needing results to survive a restart. Values are serialized so
+    callers can never mutate a cached entry through a returned dict.
+    """
+    
+    def __init__(self, maxsize: int = DEFAULT_MEMORY_CACHE_SIZE):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries; the least recently used
+                entry is evicted when it is exceeded
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached value.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value, or None on a miss
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                return None
+            self._entries.move_to_end(key)
+        
+        return json_loads(payload)
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a value in the cache.
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value to store
+        """
+        payload = json.dumps(value, ensure_ascii=False)
+        
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class SemanticCache:
+    """
+    Cache that reuses syllabi for topics with a similar meaning.
+    
+    Topics are embedded with the provider's embedding model and compared by
+    cosine similarity, so "Intro to Web Dev" can be served the syllabus
+    generated for "Introduction to Web Development". Entries only match
+    within the same scope (see make_semantic_scope). The index is kept in
+    a single JSON file.
+    """
+    
+    INDEX_FILE = "semantic_index.json"
+    
+    def __init__(
+        self,
+        embed: Callable[[str], List[float]],
+        directory: Optional[Path] = None,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        expire: Optional[float] = DEFAULT_EXPIRE_SECONDS
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            embed: Function returning an embedding vector for a text,
+                e.g. a provider's embed_text
+            directory: Directory for the index (default: ~/.cache/ai-course-creator)
+            threshold: Minimum cosine similarity for a cached entry to be reused
+            expire: Entry lifetime in seconds, or None to never expire
+        """
+        self.embed = embed
+        self.directory = Path(directory) if directory else DEFAULT_CACHE_DIR
+        self.threshold = threshold
+        self.expire = expire
+        self._entries: Optional[List[Dict[str, Any]]] = None
+        self._by_scope: Dict[str, List[Dict[str, Any]]] = {}
+        self._vectors: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, text: str, scope: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the value stored for the most similar text in a scope.
+        
+        Lookups are best-effort: if the text cannot be embedded, the
+        lookup is treated as a miss.
+        
+        Args:
+            text: Text to match, e.g. the course topic
+            scope: Key that matching entries must share exactly
+            
+        Returns:
+            Cached value, or None if no entry is similar enough
+        """
+        matches = self.search(text, scope, self.threshold)
+        return matches[0][1] if matches else None
+    
+    def search(
+        self,
+        text: str,
+        scope: str,
+        min_similarity: float
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        Find all values in a scope whose text is at least min_similarity similar.
+        
+        Args:
+            text: Text to match, e.g. the course topic
+            scope: Key that matching entries must share exactly
+            min_similarity: Minimum cosine similarity of returned entries
+            
+        Returns:
+            (similarity, value) pairs, most similar first; empty if the text
+            cannot be embedded
+        """
+        vector = self._embed(text)
+        if vector is None:
+            return []
+        
+        now = time.time()
+        matches = []
+        
+        with self._lock:
+            self._load()
+            # Only entries from the same scope are compared
+            for entry in self._by_scope.get(scope, ()):
+                if entry["expires_at"] is not None and entry["expires_at"] < now:
+                    continue
+                # Vectors are stored normalized, so the dot product is the
+                # cosine similarity
+                similarity = math.sumprod(vector, entry["vector"])
+                if similarity >= min_similarity:
+                    matches.append((similarity, entry["value"]))
+        
+        matches.sort(key=lambda match: match[0], reverse=True)
+        return matches
+    
+    def set(self, text: str, scope: str, value: Dict[str, Any]) -> None:
+        """
+        Store a value for a text.
+        
+        Caching is best-effort: embedding and write failures are ignored.
+        
+        Args:
+            text: Text the value was generated for
+            scope: Key that matching entries must share exactly
+            value: JSON-serializable value to store
+        """
+        vector = self._embed(text)
+        if vector is None:
+            return
+        
+        now = time.time()
+        
+        with self._lock:
+            # Drop expired entries and any previous entry for the same text
+            entries = [
+                entry for entry in self._load()
+                if (entry["expires_at"] is None or entry["expires_at"] >= now)
+                and not (entry["scope"] == scope and entry["text"] == text)
+            ]
+            entries.append({
+                "text": text,
+                "scope": scope,
+                "vector": vector,
+                "value": value,
+                "expires_at": now + self.expire if self.expire else None
+            })
+            self._set_entries(entries)
+            
+            try:
+                _write_json_atomic(self.directory / self.INDEX_FILE, entries)
+            except OSError:
+                pass
+    
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """Get the normalized embedding of a text, or None on failure."""
+        vector = self._vectors.get(text)
+        if vector is None:
+            try:
+                vector = list(self.embed(text))
+            except Exception:
+                return None
+            
+            norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+            vector = [x / norm for x in vector]
+            # The same text is typically looked up and then stored
+            self._vectors[text] = vector
+        return vector
+    
+    def _load(self) -> List[Dict[str, Any]]:
+        """Load the index from disk on first use. Call with the lock held."""
+        if self._entries is None:
+            try:
+                with open(self.directory / self.INDEX_FILE, encoding="utf-8") as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                entries = []
+            self._set_entries(entries)
+        return self._entries
+    
+    def _set_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """Replace the in-memory index. Call with the lock held."""
+        self._entries = entries
+        self._by_scope = {}
+        for entry in entries:
+            self._by_scope.setdefault(entry["scope"], []).append(entry)
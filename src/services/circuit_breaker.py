@@ -0,0 +1,161 @@
+"""Circuit breaker that stops calling a provider that keeps failing."""
+
+import threading
+import time
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_FAIL_MAX = 5
+DEFAULT_RESET_TIMEOUT = 60.0
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of making a call while the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast once a dependency has failed several times in a row.
+    
+    After fail_max consecutive failures the circuit opens and calls raise
+    CircuitOpenError without being made. Once reset_timeout has passed,
+    calls are let through again: a success closes the circuit, a failure
+    opens it for another reset_timeout. Thread-safe.
+    """
+    
+    def __init__(
+        self,
+        fail_max: int = DEFAULT_FAIL_MAX,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        exclude: Tuple[Type[BaseException], ...] = (),
+        is_failure: Optional[Callable[[BaseException], bool]] = None
+    ):
+        """
+        Initialize a closed circuit breaker.
+        
+        Args:
+            fail_max: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before calls are
+                tried again
+            exclude: Exception types that show the dependency is up (e.g. a
+                malformed response) and so do not count as failures
+            is_failure: Optional check of an error; errors for which it
+                returns False do not count as failures either
+        """
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.exclude = exclude
+        self.is_failure = is_failure
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        """Get the current state: 'closed', 'open' or 'half-open'."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return "open"
+            return "half-open"
+    
+    def before_call(self) -> None:
+        """
+        Check that a call may be made.
+        
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+        
+        if remaining > 0:
+            raise CircuitOpenError(
+                f"Circuit open after {self.fail_max} consecutive failures; "
+                f"retry in {remaining:.0f}s"
+            )
+    
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+    
+    def record_failure(self, error: BaseException) -> None:
+        """
+        Record a failed call, opening the circuit after fail_max in a row.
+        
+        Args:
+            error: Exception raised by the call
+        """
+        if isinstance(error, self.exclude) or (
+            self.is_failure is not None and not self.is_failure(error)
+        ):
+            self.record_success()
+            return
+        
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                # Also restarts the timeout after a failed half-open call
+                self._opened_at = time.monotonic()
+    
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Call a function through the breaker.
+        
+        Returns:
+            The function's return value
+            
+        Raises:
+            CircuitOpenError: If the circuit is open
+            Exception: Any error raised by the function
+        """
+        self.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return result
+    
+    async def acall(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        **kwargs: Any
+    ) -> T:
+        """Async counterpart of call()."""
+        self.before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return result
+    
+    def call_iter(
+        self,
+        func: Callable[..., Iterable[T]],
+        *args: Any,
+        **kwargs: Any
+    ) -> Iterator[T]:
+        """
+        Like call(), for a function returning an iterable such as a stream.
+        
+        The call is made when iteration starts, and an error at any point
+        during iteration counts as a failure.
+        """
+        self.before_call()
+        try:
+            yield from func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
@@ -1,24 +1,116 @@
 """Syllabus generation service."""
 
-from typing import Dict, Any
-from ..models.course_input import CourseInput
-from ..models.syllabus import Syllabus, Module, Lesson
-from ..providers.base_provider import BaseAIProvider
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, List, Optional, Tuple, Union
+from ..models.course_input import CourseInput, validate_topic
+from ..models.syllabus import Syllabus, Module
+from ..providers.base_provider import BaseAIProvider, SyllabusFormatError
 from ..prompts.syllabus_prompts import SyllabusPromptBuilder
+from .cache import ResponseCache, SemanticCache, make_cache_key, make_semantic_scope
+from .circuit_breaker import CircuitBreaker
+from .syllabus_stream import SyllabusStream
+from .syllabus_validation import validate_syllabus_data
+
+
+# Requests in flight at once when generating many syllabi, to stay within
+# provider rate limits
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+# Canned responses for trivial topics, keyed by the normalized topic
+_TRIVIAL_SYLLABI: Dict[str, Dict[str, Any]] = {
+    "hello world": {
+        "course_title": "Hello, World!",
+        "course_description": "A first program that prints a greeting.",
+        "target_audience": "Anyone writing their first line of code",
+        "prerequisites": [],
+        "learning_outcomes": ["Write and run a program that prints Hello, World!"],
+        "total_duration_hours": 0.5,
+        "modules": [
+            {
+                "title": "Your First Program",
+                "description": "Print a greeting to the screen.",
+                "order": 1,
+                "lessons": [
+                    {
+                        "title": "Hello, World!",
+                        "description": "Write, run and modify a one-line program.",
+                        "duration_minutes": 30,
+                        "learning_objectives": [
+                            "Run a program",
+                            "Print text to the screen"
+                        ]
+                    }
+                ]
+            }
+        ]
+    }
+}
 
 
 class SyllabusService:
     """Service for generating course syllabi using AI."""
     
-    def __init__(self, ai_provider: BaseAIProvider):
+    # Deterministic sampling keeps cached responses representative
+    CACHED_TEMPERATURE = 0.0
+    
+    # Cached syllabi for related topics are merged instead of generating
+    # from scratch when each is at least this similar to the request...
+    MERGE_MIN_SIMILARITY = 0.75
+    # ...and their similarities add up to at least this much
+    MERGE_MIN_TOTAL_SIMILARITY = 1.3
+    
+    # Repairs should change as little as possible
+    REPAIR_TEMPERATURE = 0.0
+    
+    # Output budget per syllabus when several are requested in one call
+    # and the complexity is not known
+    BATCH_TOKENS_PER_SYLLABUS = 4000
+    
+    # Output budget: course details plus an allowance per expected module
+    BASE_OUTPUT_TOKENS = 1200
+    TOKENS_PER_MODULE = 600
+    EXPECTED_MODULES = {
+        "Beginner": 4,
+        "Intermediate": 6,
+        "Advanced": 8
+    }
+    
+    def __init__(
+        self, 
+        ai_provider: BaseAIProvider,
+        cache: Optional[ResponseCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
         """
         Initialize the syllabus service.
         
         Args:
             ai_provider: AI provider instance to use for generation
+            cache: Optional exact-match response cache (DiskCache or
+                MemoryCache); when set, identical requests are served from
+                it instead of calling the provider
+            semantic_cache: Optional cache consulted after an exact-match
+                miss; requests whose topic is similar enough to a cached
+                one reuse its syllabus
+            circuit_breaker: Breaker around provider calls (default: open
+                after 5 consecutive outage errors, retry after 60 seconds);
+                rejected requests and malformed responses do not count
         """
         self.ai_provider = ai_provider
         self.prompt_builder = SyllabusPromptBuilder()
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        # Providers retry transient errors themselves, so each failure
+        # recorded here already outlasted several attempts
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            exclude=(SyllabusFormatError,),
+            is_failure=ai_provider.is_outage_error
+        )
     
     def generate_syllabus(self, course_input: CourseInput) -> Syllabus:
         """
@@ -31,66 +123,641 @@ class SyllabusService:
             Generated Syllabus object
             
         Raises:
+            ValueError: If the topic is empty or junk
             Exception: If generation fails
         """
-        # Build prompts
-        system_prompt = self.prompt_builder.get_system_prompt()
-        user_prompt = self.prompt_builder.build_syllabus_prompt(
-            course_input.to_dict()
-        )
+        system_prompt, user_prompt, cache_key = self._prepare_request(course_input)
         
-        # Generate using AI provider
-        syllabus_data = self.ai_provider.generate_syllabus(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt
-        )
+        # Generate using AI provider, reusing a cached response if available
+        syllabus_data = self._lookup(course_input, cache_key)
+        if syllabus_data is None:
+            user_prompt = self._compose_prompt(course_input, user_prompt)
+            syllabus_data = self._generate_data(
+                system_prompt, user_prompt, self._max_output_tokens(course_input)
+            )
+            self._store(course_input, cache_key, syllabus_data)
         
         # Convert to Syllabus object
         syllabus = self._parse_syllabus_data(syllabus_data)
         
         return syllabus
     
-    def _parse_syllabus_data(self, data: Dict[str, Any]) -> Syllabus:
+    async def agenerate_syllabus(self, course_input: CourseInput) -> Syllabus:
         """
-        Parse raw syllabus data into Syllabus object.
+        Generate a complete syllabus without blocking the event loop.
         
         Args:
-            data: Raw syllabus data from AI
+            course_input: User's course requirements
             
         Returns:
-            Syllabus object
+            Generated Syllabus object
+            
+        Raises:
+            ValueError: If the topic is empty or junk
+            Exception: If generation fails
+        """
+        system_prompt, user_prompt, cache_key = self._prepare_request(course_input)
+        
+        # Cache lookups may call the embeddings API, so keep them off the loop
+        syllabus_data = await asyncio.to_thread(self._lookup, course_input, cache_key)
+        if syllabus_data is None:
+            user_prompt = await asyncio.to_thread(
+                self._compose_prompt, course_input, user_prompt
+            )
+            syllabus_data = await self._agenerate_data(
+                system_prompt, user_prompt, self._max_output_tokens(course_input)
+            )
+            await asyncio.to_thread(self._store, course_input, cache_key, syllabus_data)
+        
+        return self._parse_syllabus_data(syllabus_data)
+    
+    def generate_syllabus_stream(self, course_input: CourseInput) -> SyllabusStream:
+        """
+        Generate a syllabus, making each module available as it is received.
+        
+        Args:
+            course_input: User's course requirements
+            
+        Returns:
+            SyllabusStream yielding Module objects; its ``syllabus``
+            attribute holds the complete Syllabus once iteration finishes
+            
+        Raises:
+            ValueError: If the topic is empty or junk
+            Exception: If generation fails (raised during iteration)
+        """
+        system_prompt, user_prompt, cache_key = self._prepare_request(course_input)
+        
+        syllabus_data = self._lookup(course_input, cache_key)
+        if syllabus_data is not None:
+            # Replay the cached response through the same interface
+            return SyllabusStream(
+                [json.dumps(syllabus_data)],
+                parse_syllabus=self._parse_syllabus_data,
+                parse_module=self._parse_module_data
+            )
+        
+        user_prompt = self._compose_prompt(course_input, user_prompt)
+        chunks = self.circuit_breaker.call_iter(
+            self.ai_provider.generate_syllabus_stream,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=self._temperature(),
+            max_output_tokens=self._max_output_tokens(course_input),
+            response_schema=self.prompt_builder.get_json_schema()
+        )
+        
+        return SyllabusStream(
+            chunks,
+            parse_syllabus=self._parse_syllabus_data,
+            parse_module=self._parse_module_data,
+            validate=validate_syllabus_data,
+            repair=self._repair,
+            on_complete=partial(self._store, course_input, cache_key)
+        )
+    
+    def generate_many(
+        self, 
+        course_inputs: List[CourseInput],
+        max_workers: Optional[int] = None
+    ) -> List[Syllabus]:
+        """
+        Generate several syllabi concurrently.
+        
+        Each generation is an independent, network-bound provider call, so
+        running them in a thread pool overlaps their round-trips.
+        
+        Args:
+            course_inputs: Course requirements to generate syllabi for
+            max_workers: Maximum concurrent requests (default: 8, or one
+                per input if there are fewer)
+                
+        Returns:
+            Generated Syllabus objects, in the same order as the inputs
+            
+        Raises:
+            Exception: If any generation fails
+        """
+        if not course_inputs:
+            return []
+        
+        with ThreadPoolExecutor(
+            max_workers=max_workers or min(len(course_inputs), DEFAULT_MAX_CONCURRENCY)
+        ) as executor:
+            return list(executor.map(self.generate_syllabus, course_inputs))
+    
+    async def agenerate_many(
+        self, 
+        course_inputs: List[CourseInput],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Union[Syllabus, Exception]]:
         """
-        # Parse modules
-        modules = []
-        for module_data in data.get("modules", []):
-            # Parse lessons
-            lessons = []
-            for lesson_data in module_data.get("lessons", []):
-                lesson = Lesson(
-                    title=lesson_data.get("title", ""),
-                    description=lesson_data.get("description"),
-                    duration_minutes=lesson_data.get("duration_minutes"),
-                    learning_objectives=lesson_data.get("learning_objectives", [])
+        Generate several syllabi concurrently on the event loop.
+        
+        Args:
+            course_inputs: Course requirements to generate syllabi for
+            max_concurrency: Maximum requests in flight at once, to stay
+                within provider rate limits
+                
+        Returns:
+            For each input, in order, the generated Syllabus or the
+            exception raised while generating it
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def generate(course_input: CourseInput) -> Syllabus:
+            async with semaphore:
+                return await self.agenerate_syllabus(course_input)
+        
+        return await asyncio.gather(
+            *(generate(course_input) for course_input in course_inputs),
+            return_exceptions=True
+        )
+    
+    def generate_syllabi_batch(
+        self, 
+        course_inputs: List[CourseInput],
+        rows_per_call: int = 4
+    ) -> List[Syllabus]:
+        """
+        Generate several syllabi, packing multiple courses into each request.
+        
+        The shared requirements and schema are sent once per request instead
+        of once per course. Inputs already in the cache are not re-requested.
+        
+        Args:
+            course_inputs: Course requirements to generate syllabi for
+            rows_per_call: Maximum number of courses requested per provider
+                call; fewer are packed when their output budgets would
+                exceed the model's completion token limit
+                
+        Returns:
+            Generated Syllabus objects, in the same order as the inputs
+            
+        Raises:
+            ValueError: If a topic is empty or junk, or the
+                provider returns the wrong number of syllabi
+            Exception: If generation fails
+        """
+        system_prompt = self.prompt_builder.build_static_prefix()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(course_inputs)
+        cache_keys: List[Optional[str]] = [None] * len(course_inputs)
+        pending = []
+        
+        for idx, course_input in enumerate(course_inputs):
+            # Key on the single-course request so batch and single
+            # generations share cache entries
+            _, _, cache_keys[idx] = self._prepare_request(course_input)
+            results[idx] = self._lookup(course_input, cache_keys[idx])
+            
+            if results[idx] is None:
+                pending.append(idx)
+        
+        budgets = {
+            idx: self._max_output_tokens(course_inputs[idx]) or self.BATCH_TOKENS_PER_SYLLABUS
+            for idx in pending
+        }
+        
+        for batch in self._pack_batches(pending, budgets, rows_per_call):
+            user_prompt = self.prompt_builder.build_batch_prompt(
+                [course_inputs[idx].to_dict() for idx in batch]
+            )
+            
+            syllabi_data = self.circuit_breaker.call(
+                self.ai_provider.generate_syllabi,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=self._temperature(),
+                max_output_tokens=self._clamp_output_tokens(
+                    sum(budgets[idx] for idx in batch)
+                ),
+                response_schema=self.prompt_builder.get_json_schema()
+            )
+            
+            if len(syllabi_data) != len(batch):
+                raise ValueError(
+                    f"Expected {len(batch)} syllabi in batch response, "
+                    f"got {len(syllabi_data)}"
                 )
-                lessons.append(lesson)
             
-            module = Module(
-                title=module_data.get("title", ""),
-                description=module_data.get("description"),
-                lessons=lessons,
-                order=module_data.get("order", 0)
+            for idx, syllabus_data in zip(batch, syllabi_data):
+                try:
+                    syllabus_data = validate_syllabus_data(syllabus_data)
+                except SyllabusFormatError as e:
+                    syllabus_data = self._repair(e)
+                results[idx] = syllabus_data
+                self._store(course_inputs[idx], cache_keys[idx], syllabus_data)
+        
+        return [self._parse_syllabus_data(data) for data in results]
+    
+    def generate_syllabi_offline_batch(
+        self, 
+        course_inputs: List[CourseInput],
+        poll_interval: float = 30.0
+    ) -> List[Union[Syllabus, Exception]]:
+        """
+        Generate several syllabi through the provider's offline batch API.
+        
+        Batch APIs trade latency (minutes to hours) for lower token cost;
+        use this for bulk jobs where nobody is waiting on the result.
+        Providers without one run the requests one after another. Inputs
+        already in the cache are not re-requested. A failed request does not
+        discard the others: every successful result is cached.
+        
+        Args:
+            course_inputs: Course requirements to generate syllabi for
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            For each input, in order, the generated Syllabus or the
+            exception raised for its request
+            
+        Raises:
+            ValueError: If a topic is empty or junk
+            Exception: If the batch as a whole fails
+        """
+        results: List[Union[Dict[str, Any], Exception, None]] = [None] * len(course_inputs)
+        cache_keys: List[Optional[str]] = [None] * len(course_inputs)
+        pending = []
+        requests = []
+        
+        for idx, course_input in enumerate(course_inputs):
+            system_prompt, user_prompt, cache_keys[idx] = self._prepare_request(course_input)
+            results[idx] = self._lookup(course_input, cache_keys[idx])
+            
+            if results[idx] is None:
+                pending.append(idx)
+                requests.append({
+                    "system_prompt": system_prompt,
+                    "user_prompt": user_prompt,
+                    "temperature": self._temperature(),
+                    "max_output_tokens": self._max_output_tokens(course_input),
+                    "response_schema": self.prompt_builder.get_json_schema()
+                })
+        
+        if requests:
+            responses = self.circuit_breaker.call(
+                self.ai_provider.generate_syllabi_offline,
+                requests, poll_interval=poll_interval
+            )
+            
+            for idx, response in zip(pending, responses):
+                try:
+                    try:
+                        if isinstance(response, Exception):
+                            raise response
+                        syllabus_data = validate_syllabus_data(response)
+                    except SyllabusFormatError as e:
+                        syllabus_data = self._repair(e)
+                except Exception as e:
+                    results[idx] = e
+                    continue
+                results[idx] = syllabus_data
+                self._store(course_inputs[idx], cache_keys[idx], syllabus_data)
+        
+        return [
+            data if isinstance(data, Exception) else self._parse_syllabus_data(data)
+            for data in results
+        ]
+    
+    def _generate_data(
+        self, 
+        system_prompt: str, 
+        user_prompt: str,
+        max_output_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Request and validate raw syllabus data, repairing it once if needed.
+        
+        Args:
+            system_prompt: System prompt for the provider
+            user_prompt: User prompt for the provider
+            max_output_tokens: Optional cap on generated tokens
+            
+        Returns:
+            Raw syllabus data matching the schema
+            
+        Raises:
+            SyllabusFormatError: If the response is still invalid after repair
+            Exception: If generation fails
+        """
+        try:
+            return validate_syllabus_data(self.circuit_breaker.call(
+                self.ai_provider.generate_syllabus,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=self._temperature(),
+                max_output_tokens=max_output_tokens,
+                response_schema=self.prompt_builder.get_json_schema()
+            ))
+        except SyllabusFormatError as e:
+            return self._repair(e)
+    
+    async def _agenerate_data(
+        self, 
+        system_prompt: str, 
+        user_prompt: str,
+        max_output_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of _generate_data()."""
+        try:
+            return validate_syllabus_data(await self.circuit_breaker.acall(
+                self.ai_provider.agenerate_syllabus,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=self._temperature(),
+                max_output_tokens=max_output_tokens,
+                response_schema=self.prompt_builder.get_json_schema()
+            ))
+        except SyllabusFormatError as e:
+            system_prompt, user_prompt = self._repair_prompts(e)
+            return validate_syllabus_data(await self.circuit_breaker.acall(
+                self.ai_provider.agenerate_syllabus,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=self.REPAIR_TEMPERATURE,
+                response_schema=self.prompt_builder.get_json_schema()
+            ))
+    
+    def _repair(self, error: SyllabusFormatError) -> Dict[str, Any]:
+        """
+        Ask the provider to fix an invalid response.
+        
+        Malformed output is usually cut off or slightly off-schema, so
+        sending it back with the error is a cheaper and more reliable fix
+        than generating from scratch.
+        
+        Args:
+            error: Error carrying the invalid response text
+            
+        Returns:
+            Repaired raw syllabus data
+            
+        Raises:
+            SyllabusFormatError: If the repaired response is still invalid
+        """
+        system_prompt, user_prompt = self._repair_prompts(error)
+        
+        return validate_syllabus_data(self.circuit_breaker.call(
+            self.ai_provider.generate_syllabus,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=self.REPAIR_TEMPERATURE,
+            response_schema=self.prompt_builder.get_json_schema()
+        ))
+    
+    def _repair_prompts(self, error: SyllabusFormatError) -> Tuple[str, str]:
+        """Build the (system_prompt, user_prompt) pair for a repair request."""
+        return (
+            self.prompt_builder.build_static_prefix(),
+            self.prompt_builder.build_repair_prompt(error.content, str(error))
+        )
+    
+    def _prepare_request(
+        self, 
+        course_input: CourseInput
+    ) -> Tuple[str, str, Optional[str]]:
+        """
+        Build the prompts and cache key for a single generation.
+        
+        Args:
+            course_input: User's course requirements
+            
+        Returns:
+            Tuple of (system_prompt, user_prompt, cache_key); cache_key is
+            None when caching is disabled
+        """
+        # Keep the static part first so providers can reuse their cached
+        # processing of it across requests
+        system_prompt = self.prompt_builder.build_static_prefix()
+        user_prompt = self.prompt_builder.build_variable_suffix(
+            course_input.topic,
+            course_input.complexity,
+            course_input.age_group,
+            course_input.tone
+        )
+        
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(
+                course_input, self.ai_provider, system_prompt, user_prompt
             )
-            modules.append(module)
-        
-        # Create syllabus
-        syllabus = Syllabus(
-            course_title=data.get("course_title", ""),
-            course_description=data.get("course_description", ""),
-            target_audience=data.get("target_audience"),
-            prerequisites=data.get("prerequisites", []),
-            learning_outcomes=data.get("learning_outcomes", []),
-            modules=modules,
-            total_duration_hours=data.get("total_duration_hours")
+        
+        return system_prompt, user_prompt, cache_key
+    
+    def _lookup(
+        self, 
+        course_input: CourseInput,
+        cache_key: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find cached syllabus data for a request.
+        
+        Trivial requests are answered from canned data first. The
+        exact-match cache is checked next; the semantic cache is only
+        consulted (and its embedding computed) on a miss.
+        
+        Args:
+            course_input: User's course requirements
+            cache_key: Exact-match cache key, or None if that cache is disabled
+            
+        Returns:
+            Cached raw syllabus data, or None on a miss
+            
+        Raises:
+            ValueError: If the topic is empty or junk
+        """
+        syllabus_data = self._short_circuit(course_input)
+        if syllabus_data is not None:
+            return syllabus_data
+        
+        if cache_key:
+            syllabus_data = self.cache.get(cache_key)
+            if syllabus_data is not None:
+                return syllabus_data
+        
+        if self.semantic_cache is None:
+            return None
+        
+        syllabus_data = self.semantic_cache.get(
+            course_input.topic, self._semantic_scope(course_input)
         )
+        if syllabus_data is not None and cache_key:
+            # Serve repeats of this exact request without an embedding call
+            self.cache.set(cache_key, syllabus_data)
         
-        return syllabus
+        return syllabus_data
+    
+    def _short_circuit(self, course_input: CourseInput) -> Optional[Dict[str, Any]]:
+        """
+        Handle requests that should never reach the provider.
+        
+        Args:
+            course_input: User's course requirements
+            
+        Returns:
+            Canned raw syllabus data for a trivial topic, or None if the
+            request needs generating
+            
+        Raises:
+            ValueError: If the topic is empty or junk
+        """
+        validate_topic(course_input.topic)
+        
+        # Copied so callers cannot modify the canned data
+        canned = _TRIVIAL_SYLLABI.get(" ".join(course_input.topic.split()).casefold())
+        return json.loads(json.dumps(canned)) if canned is not None else None
+    
+    def _store(
+        self, 
+        course_input: CourseInput,
+        cache_key: Optional[str],
+        syllabus_data: Dict[str, Any]
+    ) -> None:
+        """
+        Store newly generated syllabus data in the enabled caches.
+        
+        Args:
+            course_input: User's course requirements
+            cache_key: Exact-match cache key, or None if that cache is disabled
+            syllabus_data: Raw syllabus data to store
+        """
+        if cache_key:
+            self.cache.set(cache_key, syllabus_data)
+        
+        if self.semantic_cache is not None:
+            self.semantic_cache.set(
+                course_input.topic, self._semantic_scope(course_input), syllabus_data
+            )
+    
+    def _compose_prompt(self, course_input: CourseInput, user_prompt: str) -> str:
+        """
+        Turn a request into a merge of cached syllabi for related topics, if any.
+        
+        Composite requests (e.g. "Python and Pandas for data analysis")
+        often have no close match but several partial ones. When enough
+        related syllabi are cached, the provider is asked to merge their
+        modules instead of writing the syllabus from scratch.
+        
+        Args:
+            course_input: User's course requirements
+            user_prompt: Regular request-specific prompt
+            
+        Returns:
+            Merge prompt, or user_prompt unchanged if too few related
+            syllabi are cached
+        """
+        if self.semantic_cache is None:
+            return user_prompt
+        
+        matches = self.semantic_cache.search(
+            course_input.topic,
+            self._semantic_scope(course_input),
+            self.MERGE_MIN_SIMILARITY
+        )
+        if sum(similarity for similarity, _ in matches) < self.MERGE_MIN_TOTAL_SIMILARITY:
+            return user_prompt
+        
+        return self.prompt_builder.build_merge_prompt(
+            user_prompt, [syllabus_data for _, syllabus_data in matches]
+        )
+    
+    def _semantic_scope(self, course_input: CourseInput) -> str:
+        """Get the semantic cache scope for a request."""
+        return make_semantic_scope(
+            course_input, self.ai_provider, self.prompt_builder.build_static_prefix()
+        )
+    
+    def _max_output_tokens(self, course_input: CourseInput) -> Optional[int]:
+        """
+        Estimate the output token budget for a single syllabus.
+        
+        Args:
+            course_input: User's course requirements
+            
+        Returns:
+            Token cap sized to the expected number of modules and clamped
+            to the model's limit, or None to use the provider default when
+            the complexity is not set
+        """
+        modules = self.EXPECTED_MODULES.get(course_input.complexity)
+        if modules is None:
+            return None
+        return self._clamp_output_tokens(
+            self.BASE_OUTPUT_TOKENS + self.TOKENS_PER_MODULE * modules
+        )
+    
+    def _clamp_output_tokens(self, max_output_tokens: int) -> int:
+        """Limit an output budget to what the provider's model can generate."""
+        limit = self.ai_provider.output_token_limit()
+        return min(max_output_tokens, limit) if limit else max_output_tokens
+    
+    def _pack_batches(
+        self,
+        pending: List[int],
+        budgets: Dict[int, int],
+        rows_per_call: int
+    ) -> List[List[int]]:
+        """
+        Split pending inputs into provider calls.
+        
+        Each call holds at most rows_per_call inputs whose output budgets
+        add up to no more than the model's limit; an input whose own budget
+        exceeds the limit gets a call to itself.
+        
+        Args:
+            pending: Indexes of the inputs to generate, in order
+            budgets: Output token budget for each index
+            rows_per_call: Maximum number of inputs per call
+            
+        Returns:
+            Index lists, one per provider call
+        """
+        limit = self.ai_provider.output_token_limit()
+        batches: List[List[int]] = []
+        batch: List[int] = []
+        total = 0
+        
+        for idx in pending:
+            if batch and (
+                len(batch) >= rows_per_call
+                or (limit and total + budgets[idx] > limit)
+            ):
+                batches.append(batch)
+                batch, total = [], 0
+            batch.append(idx)
+            total += budgets[idx]
+        
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    def _temperature(self) -> Optional[float]:
+        """Get the sampling temperature override for provider calls."""
+        if self.cache is None and self.semantic_cache is None:
+            return None
+        return self.CACHED_TEMPERATURE
+    
+    def _parse_syllabus_data(self, data: Dict[str, Any]) -> Syllabus:
+        """
+        Parse raw syllabus data into Syllabus object.
+        
+        Args:
+            data: Raw syllabus data from AI
+            
+        Returns:
+            Syllabus object
+        """
+        return Syllabus.from_dict(data)
+    
+    def _parse_module_data(self, module_data: Dict[str, Any]) -> Module:
+        """
+        Parse raw module data into Module object.
+        
+        Args:
+            module_data: Raw module data from AI
+            
+        Returns:
+            Module object
+        """
+        return Module.from_dict(module_data)
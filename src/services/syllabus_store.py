@@ -0,0 +1,81 @@
+"""Persistent store of generated syllabi, addressed by course input."""
+
+import hashlib
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+from ..models.course_input import CourseInput
+from ..models.syllabus import Syllabus
+from ..utils.json_utils import loads as json_loads
+from .cache import DEFAULT_CACHE_DIR, _write_json_atomic
+
+
+class SyllabusStore:
+    """
+    File-backed store of finished syllabi, one JSON file per course input.
+    
+    Unlike the response caches, entries depend only on what the user asked
+    for, not on the provider, model or prompt, so a syllabus can be shown
+    again without setting up a provider at all. Entries never expire.
+    """
+    
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        Initialize the store.
+        
+        Args:
+            directory: Directory for stored syllabi
+                (default: ~/.cache/ai-course-creator/syllabi)
+        """
+        self.directory = Path(directory) if directory else DEFAULT_CACHE_DIR / "syllabi"
+    
+    @staticmethod
+    def make_key(course_input: CourseInput) -> str:
+        """
+        Build the key identifying a course input.
+        
+        Args:
+            course_input: User's course requirements
+            
+        Returns:
+            Hex digest of the input
+        """
+        return hashlib.blake2b(
+            course_input.to_canonical_json(), digest_size=8
+        ).hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        """Get the file path for a key."""
+        return self.directory / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[Syllabus]:
+        """
+        Load a stored syllabus.
+        
+        Args:
+            key: Key from make_key()
+            
+        Returns:
+            Stored syllabus, or None if there is none or it is unreadable
+        """
+        try:
+            with open(self._path(key), "rb") as f:
+                return Syllabus.from_dict(json_loads(f.read()))
+        except (OSError, ValueError, AttributeError):
+            return None
+    
+    def put(self, key: str, syllabus: Syllabus) -> None:
+        """
+        Store a syllabus, replacing any previous one for the key.
+        
+        Storing is best-effort: write failures are ignored.
+        
+        Args:
+            key: Key from make_key()
+            syllabus: Syllabus to store
+        """
+        try:
+            _write_json_atomic(self._path(key), asdict(syllabus))
+        except OSError:
+            pass
@@ -0,0 +1,226 @@
+"""Incremental parsing of streamed syllabus responses."""
+
+import json
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from ..models.syllabus import Syllabus, Module
+from ..providers.base_provider import SyllabusFormatError
+from ..utils.json_utils import loads as json_loads
+
+
+# The only characters that can change the parser state; everything between
+# them is skipped without a Python-level loop
+_STRUCTURAL_RE = re.compile(r'[\\"{}\[\]]')
+
+
+class SyllabusStreamParser:
+    """
+    Extracts modules from a syllabus JSON document while it is being received.
+    
+    Feed response chunks in order; each module object is returned as soon as
+    its closing brace arrives, without waiting for the rest of the document.
+    """
+    
+    def __init__(self):
+        """Initialize an empty parser."""
+        self.header: Optional[Dict[str, Any]] = None
+        self._chunks: List[str] = []
+        self._length = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._key_start = 0
+        self._key_end = 0
+        self._in_modules = False
+        self._module_start: Optional[int] = None
+    
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        Add the next chunk of the response.
+        
+        Only the new chunk is scanned, and the text received so far is only
+        joined when a module or the header is complete, so the total work
+        stays linear however small the chunks are.
+        
+        Args:
+            chunk: Next piece of the JSON response text
+            
+        Returns:
+            Raw data of each module completed by this chunk
+            
+        Raises:
+            SyllabusFormatError: If a completed module is not valid JSON
+        """
+        offset = self._length
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+        modules = []
+        
+        skip_to = 0
+        if self._escape and chunk:
+            # The previous chunk ended with a backslash inside a string
+            self._escape = False
+            skip_to = 1
+        
+        for match in _STRUCTURAL_RE.finditer(chunk, skip_to):
+            local_pos = match.start()
+            if local_pos < skip_to:
+                continue
+            char = chunk[local_pos]
+            pos = offset + local_pos
+            
+            if self._in_string:
+                if char == "\\":
+                    # Skip the escaped character, which may be in the next chunk
+                    if local_pos + 1 < len(chunk):
+                        skip_to = local_pos + 2
+                    else:
+                        self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        # Remember top-level strings; the one before an
+                        # array opens is that array's key
+                        self._key_start = self._string_start
+                        self._key_end = pos
+                continue
+            
+            if char == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif char in "{[":
+                if char == "[" and self._depth == 1 and self._last_key() == "modules":
+                    self._in_modules = True
+                    self.header = self._parse_header(self._text()[:self._key_start])
+                elif char == "{" and self._in_modules and self._depth == 2:
+                    self._module_start = pos
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if char == "}" and self._in_modules and self._depth == 2:
+                    modules.append(
+                        self._parse_module(self._text()[self._module_start:pos + 1])
+                    )
+                    self._module_start = None
+                elif char == "]" and self._in_modules and self._depth == 1:
+                    self._in_modules = False
+        
+        return modules
+    
+    def result(self) -> Dict[str, Any]:
+        """
+        Parse the complete response once all chunks have been fed.
+        
+        Returns:
+            Dictionary with syllabus data
+            
+        Raises:
+            SyllabusFormatError: If the response is not valid JSON
+        """
+        text = self._text()
+        try:
+            return json_loads(text)
+        except json.JSONDecodeError as e:
+            raise SyllabusFormatError(f"Failed to parse JSON response: {e}", text)
+    
+    def _text(self) -> str:
+        """Get the text received so far."""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+    
+    def _last_key(self) -> str:
+        """Get the most recent top-level string, i.e. the current key."""
+        return self._text()[self._key_start + 1:self._key_end]
+    
+    @staticmethod
+    def _parse_header(text: str) -> Dict[str, Any]:
+        """Parse the top-level fields that precede the modules array."""
+        try:
+            return json_loads(text.rstrip().rstrip(",") + "}")
+        except json.JSONDecodeError:
+            return {}
+    
+    def _parse_module(self, text: str) -> Dict[str, Any]:
+        """Parse a single completed module object."""
+        try:
+            return json_loads(text)
+        except json.JSONDecodeError as e:
+            raise SyllabusFormatError(
+                f"Failed to parse JSON response: {e}", self._text()
+            )
+
+
+class SyllabusStream:
+    """
+    Iterable of modules from a syllabus generation that is still in progress.
+    
+    Iterating yields each Module as soon as it has been received. After the
+    first module, ``header`` holds the course details sent before the
+    modules; once iteration finishes, ``syllabus`` holds the full result.
+    If the complete response turns out to be invalid and a repair callback
+    is given, ``syllabus`` holds the repaired result instead, which may
+    differ from the modules already yielded.
+    """
+    
+    def __init__(
+        self,
+        chunks: Iterable[str],
+        parse_syllabus: Callable[[Dict[str, Any]], Syllabus],
+        parse_module: Callable[[Dict[str, Any]], Module],
+        validate: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        repair: Optional[Callable[[SyllabusFormatError], Dict[str, Any]]] = None,
+        on_complete: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Initialize the stream.
+        
+        Args:
+            chunks: Consecutive chunks of the JSON response
+            parse_syllabus: Converts raw syllabus data into a Syllabus
+            parse_module: Converts raw module data into a Module
+            validate: Optional check of the complete raw data, raising
+                SyllabusFormatError if it is invalid
+            repair: Optional callback returning fixed raw data for an
+                invalid response
+            on_complete: Optional callback receiving the complete raw data
+        """
+        self.header: Optional[Syllabus] = None
+        self.syllabus: Optional[Syllabus] = None
+        self._chunks = chunks
+        self._parse_syllabus = parse_syllabus
+        self._parse_module = parse_module
+        self._validate = validate
+        self._repair = repair
+        self._on_complete = on_complete
+    
+    def __iter__(self) -> Iterator[Module]:
+        """Yield modules as they are received."""
+        parser = SyllabusStreamParser()
+        chunks = iter(self._chunks)
+        
+        try:
+            for chunk in chunks:
+                for module_data in parser.feed(chunk):
+                    if self.header is None:
+                        self.header = self._parse_syllabus(parser.header or {})
+                    yield self._parse_module(module_data)
+            
+            syllabus_data = parser.result()
+            if self._validate is not None:
+                syllabus_data = self._validate(syllabus_data)
+        except SyllabusFormatError as e:
+            if self._repair is None:
+                raise
+            # A malformed module stops the parse part-way through; the
+            # repair needs the rest of the response too
+            syllabus_data = self._repair(
+                SyllabusFormatError(str(e), e.content + "".join(chunks))
+            )
+        
+        if self._on_complete is not None:
+            self._on_complete(syllabus_data)
+        
+        self.syllabus = self._parse_syllabus(syllabus_data)
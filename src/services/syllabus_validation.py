@@ -0,0 +1,104 @@
+"""Schema validation for raw syllabus data returned by providers."""
+
+import json
+from typing import Any, Dict
+
+from ..prompts.syllabus_prompts import SyllabusPromptBuilder
+from ..providers.base_provider import SyllabusFormatError
+
+
+# The JSON Schema requires every field, as strict structured output modes
+# demand, but models that do not enforce it sometimes leave some out. Only
+# these fields are needed to build a usable Syllabus (from_dict() fills in
+# the rest), so only they are required here; a field name counts at every
+# level, e.g. "title" for both modules and lessons.
+ESSENTIAL_FIELDS = frozenset({
+    "course_title",
+    "course_description",
+    "modules",
+    "title",
+    "lessons"
+})
+
+_SCHEMA_TYPES = {"string": str, "integer": int, "number": float}
+
+
+def _field_spec(schema: Dict[str, Any]) -> Any:
+    """
+    Convert a JSON Schema into the field spec checked by _check().
+    
+    A field spec is (type, required), where type is str, int, float, a dict
+    of nested field specs, or a one-element list of an item type. Optional
+    fields may also be missing or null.
+    """
+    if schema["type"] == "object":
+        return {
+            name: (_field_spec(field), name in ESSENTIAL_FIELDS)
+            for name, field in schema["properties"].items()
+        }
+    if schema["type"] == "array":
+        return [_field_spec(schema["items"])]
+    return _SCHEMA_TYPES[schema["type"]]
+
+
+# Expected shape of a syllabus response, derived from the prompt's schema
+SYLLABUS_FIELDS = _field_spec(SyllabusPromptBuilder.get_json_schema())
+
+_TYPE_NAMES = {str: "a string", int: "an integer", float: "a number"}
+
+
+def validate_syllabus_data(data: Any) -> Dict[str, Any]:
+    """
+    Check that raw syllabus data matches the expected schema.
+    
+    Args:
+        data: Parsed JSON response from a provider
+        
+    Returns:
+        The same data, for chaining
+        
+    Raises:
+        SyllabusFormatError: If a required field is missing or a field
+            has the wrong type
+    """
+    error = _check(data, SYLLABUS_FIELDS, "syllabus")
+    if error:
+        raise SyllabusFormatError(
+            f"Invalid syllabus response: {error}",
+            json.dumps(data, ensure_ascii=False)
+        )
+    
+    return data
+
+
+def _check(value: Any, spec: Any, path: str) -> str:
+    """Return a description of the first schema violation, or ''."""
+    if isinstance(spec, dict):
+        if not isinstance(value, dict):
+            return f"{path} must be an object"
+        for name, (field_spec, required) in spec.items():
+            field_value = value.get(name)
+            if field_value is None:
+                if required:
+                    return f"{path}.{name} is missing"
+                continue
+            error = _check(field_value, field_spec, f"{path}.{name}")
+            if error:
+                return error
+        return ""
+    
+    if isinstance(spec, list):
+        if not isinstance(value, list):
+            return f"{path} must be a list"
+        for idx, item in enumerate(value):
+            error = _check(item, spec[0], f"{path}[{idx}]")
+            if error:
+                return error
+        return ""
+    
+    # bool is a subclass of int but never a valid number here; float
+    # fields also accept integers
+    accepted = (int, float) if spec is float else spec
+    if isinstance(value, bool) or not isinstance(value, accepted):
+        return f"{path} must be {_TYPE_NAMES[spec]}"
+    return ""
@@ -1,8 +1,24 @@
 """Display utilities for formatted output."""
 
+import sys
+from typing import TYPE_CHECKING, Union
+
 from ..models.course_input import CourseInput
 from ..models.syllabus import Syllabus
 
+if TYPE_CHECKING:
+    from ..services.syllabus_stream import SyllabusStream
+
+
+_RULE = "=" * 60
+_SYLLABUS_BANNER = f"\n{_RULE}\nGenerated Syllabus\n{_RULE}\n\n"
+
+
+def _write(text: str) -> None:
+    """Write text to stdout with a single call and flush it."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
 
 class Display:
     """Handles formatted display of information."""
@@ -15,27 +31,67 @@ class Display:
         Args:
             inputs: CourseInput object to display
         """
-        print("\n" + "=" * 60)
-        print("Collected Information:")
-        print("=" * 60)
-        print(inputs)
-        print("=" * 60)
+        _write(f"\n{_RULE}\nCollected Information:\n{_RULE}\n{inputs}\n{_RULE}\n")
     
     @staticmethod
-    def print_syllabus(syllabus: Syllabus) -> None:
+    def print_syllabus(syllabus: Union[Syllabus, "SyllabusStream"]) -> Syllabus:
         """
         Print syllabus in a formatted way.
         
         Args:
-            syllabus: Syllabus object to display
+            syllabus: Syllabus object to display, or a SyllabusStream to
+                display module by module as it is generated
+                
+        Returns:
+            The complete Syllabus object
         """
-        print("\n" + "=" * 60)
-        print("Generated Syllabus")
-        print("=" * 60)
-        print()
-        print(syllabus.to_markdown())
-        print()
-        print("=" * 60)
+        if not isinstance(syllabus, Syllabus):
+            return Display.print_syllabus_stream(syllabus)
+        
+        _write(f"{_SYLLABUS_BANNER}{syllabus.to_markdown()}\n\n{_RULE}\n")
+        
+        return syllabus
+    
+    @staticmethod
+    def print_syllabus_stream(stream: "SyllabusStream") -> Syllabus:
+        """
+        Print a syllabus while it is being generated, one module at a time.
+        
+        Args:
+            stream: SyllabusStream from SyllabusService.generate_syllabus_stream()
+            
+        Returns:
+            The complete Syllabus object
+        """
+        _write(_SYLLABUS_BANNER)
+        
+        # One write per module, so each appears as soon as it is received
+        printed = 0
+        for printed, module in enumerate(stream, 1):
+            if printed == 1:
+                _write(f"{stream.header.to_markdown_header()}\n{module.to_markdown(printed)}\n")
+            else:
+                _write(f"{module.to_markdown(printed)}\n")
+        
+        # A repaired response may hold modules that were never streamed
+        syllabus = stream.syllabus
+        if not printed:
+            tail = [syllabus.to_markdown()]
+        else:
+            tail = [
+                module.to_markdown(idx)
+                for idx, module in enumerate(syllabus.modules[printed:], printed + 1)
+            ]
+            # Fields sent after the modules (e.g. Gemini orders schema
+            # properties alphabetically) were missing from the header
+            # shown at the start, so show the complete details again
+            details = syllabus.to_markdown_details()
+            if details != stream.header.to_markdown_details():
+                tail.append(details)
+        tail.append(f"\n{_RULE}\n")
+        _write("\n".join(tail))
+        
+        return syllabus
     
     @staticmethod
     def print_error(message: str) -> None:
@@ -45,10 +101,7 @@ class Display:
         Args:
             message: Error message to display
         """
-        print("\n" + "!" * 60)
-        print("ERROR:")
-        print(message)
-        print("!" * 60)
+        _write(f"\n{'!' * 60}\nERROR:\n{message}\n{'!' * 60}\n")
     
     @staticmethod
     def print_success(message: str) -> None:
@@ -58,9 +111,7 @@ class Display:
         Args:
             message: Success message to display
         """
-        print("\n" + "✓" * 60)
-        print(message)
-        print("✓" * 60)
+        _write(f"\n{'✓' * 60}\n{message}\n{'✓' * 60}\n")
     
     @staticmethod
     def print_info(message: str) -> None:
@@ -70,4 +121,4 @@ class Display:
         Args:
             message: Info message to display
         """
-        print(f"\n[INFO] {message}")
+        _write(f"\n[INFO] {message}\n")
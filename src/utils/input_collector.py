@@ -1,16 +1,33 @@
 """User input collection utilities."""
 
-from ..models.course_input import CourseInput
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..models.course_input import CourseInput, validate_topic
 
 
 class InputCollector:
     """Handles collecting user inputs for course generation."""
     
+    # Optional course details, asked in this order after the topic:
+    # (CourseInput field, label, menu options or None for free text)
+    OPTIONAL_FIELDS: List[Tuple[str, str, Optional[List[str]]]] = [
+        ("complexity", "Complexity Level", ["Beginner", "Intermediate", "Advanced"]),
+        ("age_group", "Age group", None),
+        ("tone", "Tone/Style", ["Academic", "Casual", "Professional", "Humorous"])
+    ]
+    
     @staticmethod
-    def collect_course_inputs() -> CourseInput:
+    def collect_course_inputs(
+        on_topic: Optional[Callable[[str], None]] = None
+    ) -> CourseInput:
         """
         Collect user inputs for syllabus generation.
         
+        Args:
+            on_topic: Optional callback receiving the topic as soon as it is
+                entered, e.g. to start preparing the provider while the
+                remaining questions are answered
+                
         Returns:
             CourseInput object with user's specifications
         """
@@ -19,50 +36,41 @@ class InputCollector:
         print("=" * 60)
         print()
         
-        # Required: Main topic/subject
-        topic = input("Enter the course topic/subject: ").strip()
-        while not topic:
-            print("Topic cannot be empty. Please enter a topic.")
+        # Required: Main topic/subject, rejected here rather than after the
+        # provider has been set up
+        while True:
             topic = input("Enter the course topic/subject: ").strip()
+            try:
+                validate_topic(topic)
+                break
+            except ValueError as e:
+                print(f"{e}. Please enter a topic.")
         
-        # Optional: Complexity level
-        print("\nComplexity Level (optional - press Enter to skip):")
-        print("1. Beginner")
-        print("2. Intermediate")
-        print("3. Advanced")
-        complexity_choice = input("Select complexity (1-3 or Enter to skip): ").strip()
+        if on_topic is not None:
+            on_topic(topic)
         
-        complexity_map = {
-            "1": "Beginner",
-            "2": "Intermediate",
-            "3": "Advanced"
-        }
-        complexity = complexity_map.get(complexity_choice) if complexity_choice else None
+        details: Dict[str, Optional[str]] = {}
+        for field, label, options in InputCollector.OPTIONAL_FIELDS:
+            if options is None:
+                details[field] = InputCollector._prompt_text(label)
+            else:
+                details[field] = InputCollector._prompt_choice(field, label, options)
         
-        # Optional: Age group
-        age_group = input("\nAge group (optional - press Enter to skip): ").strip()
-        if not age_group:
-            age_group = None
-        
-        # Optional: Tone/Style
-        print("\nTone/Style (optional - press Enter to skip):")
-        print("1. Academic")
-        print("2. Casual")
-        print("3. Professional")
-        print("4. Humorous")
-        tone_choice = input("Select tone (1-4 or Enter to skip): ").strip()
+        return CourseInput(topic=topic, **details)
+    
+    @staticmethod
+    def _prompt_text(label: str) -> Optional[str]:
+        """Ask for optional free text; returns None if skipped."""
+        return input(f"\n{label} (optional - press Enter to skip): ").strip() or None
+    
+    @staticmethod
+    def _prompt_choice(name: str, label: str, options: List[str]) -> Optional[str]:
+        """Ask for an optional numbered menu choice; returns None if skipped or invalid."""
+        choices = {str(idx): option for idx, option in enumerate(options, 1)}
         
-        tone_map = {
-            "1": "Academic",
-            "2": "Casual",
-            "3": "Professional",
-            "4": "Humorous"
-        }
-        tone = tone_map.get(tone_choice) if tone_choice else None
+        print(f"\n{label} (optional - press Enter to skip):")
+        for idx, option in choices.items():
+            print(f"{idx}. {option}")
+        choice = input(f"Select {name} (1-{len(options)} or Enter to skip): ").strip()
         
-        return CourseInput(
-            topic=topic,
-            complexity=complexity,
-            age_group=age_group,
-            tone=tone
-        )
+        return choices.get(choice)
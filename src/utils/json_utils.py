@@ -0,0 +1,42 @@
+"""JSON helpers using the fastest available parser."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    # orjson has no wheel for this platform, try msgspec instead
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    # msgspec not installed, fall back to the standard library
+    msgspec = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document with orjson, or msgspec or json if it is missing.
+    
+    Args:
+        data: JSON text
+        
+    Returns:
+        Parsed Python object
+        
+    Raises:
+        json.JSONDecodeError: If the document is invalid (orjson's error
+            type subclasses it; msgspec's is converted)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            if isinstance(data, bytes):
+                data = data.decode("utf-8", "replace")
+            raise json.JSONDecodeError(str(e), data, 0) from None
+    return json.loads(data)
@@ -0,0 +1,76 @@
+"""Test doubles shared by the test modules."""
+
+import copy
+from typing import Any, Dict, List, Optional
+
+from src.providers.base_provider import BaseAIProvider
+
+
+SYLLABUS = {
+    "course_title": "Intro to Python",
+    "course_description": "Learn Python.",
+    "target_audience": "Beginners",
+    "prerequisites": [],
+    "learning_outcomes": ["Write scripts"],
+    "total_duration_hours": 10,
+    "modules": [
+        {
+            "title": "Basics",
+            "description": "Start here",
+            "order": 1,
+            "lessons": [
+                {
+                    "title": "Variables",
+                    "description": "Names and values",
+                    "duration_minutes": 30,
+                    "learning_objectives": ["Assign a value"]
+                }
+            ]
+        }
+    ]
+}
+
+
+def syllabus(**overrides: Any) -> Dict[str, Any]:
+    """Get a fresh copy of the sample syllabus with some fields replaced."""
+    data = copy.deepcopy(SYLLABUS)
+    data.update(overrides)
+    return data
+
+
+class FakeProvider(BaseAIProvider):
+    """
+    Provider that returns queued responses and records every call.
+    
+    Each queued response is returned, or raised if it is an exception; once
+    the queue is empty the sample syllabus is returned.
+    """
+    
+    def __init__(self, responses: Optional[List[Any]] = None, model: str = "fake-1"):
+        super().__init__("test-key")
+        self.model = model
+        self.responses = list(responses or [])
+        self.calls: List[Dict[str, Any]] = []
+    
+    def generate_syllabus(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        self.calls.append({
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "temperature": temperature,
+            "max_output_tokens": max_output_tokens,
+            "response_schema": response_schema
+        })
+        response = self.responses.pop(0) if self.responses else syllabus()
+        if isinstance(response, BaseException):
+            raise response
+        return response
+    
+    def validate_api_key(self) -> bool:
+        return True
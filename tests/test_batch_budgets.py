@@ -0,0 +1,93 @@
+"""Tests for output token budgets and batch packing."""
+
+import unittest
+
+from src.models.course_input import CourseInput
+from src.services.syllabus_service import SyllabusService
+from tests.fakes import FakeProvider, syllabus
+
+
+def make_service(limit=None):
+    """Build a service whose model can generate at most limit tokens."""
+    provider = FakeProvider(model="fake-1")
+    if limit is not None:
+        provider.OUTPUT_TOKEN_LIMITS = {"fake": limit}
+    return SyllabusService(provider)
+
+
+class OutputBudgetTest(unittest.TestCase):
+
+    def test_budget_follows_complexity(self):
+        service = make_service()
+        
+        self.assertEqual(service._max_output_tokens(CourseInput("Python", "Beginner")), 3600)
+        self.assertEqual(service._max_output_tokens(CourseInput("Python", "Advanced")), 6000)
+        self.assertIsNone(service._max_output_tokens(CourseInput("Python")))
+    
+    def test_budget_is_clamped_to_model_limit(self):
+        service = make_service(limit=4096)
+        
+        self.assertEqual(service._max_output_tokens(CourseInput("Python", "Advanced")), 4096)
+        self.assertEqual(service._max_output_tokens(CourseInput("Python", "Beginner")), 3600)
+    
+    def test_longest_model_prefix_wins(self):
+        provider = FakeProvider(model="fake-1-large")
+        provider.OUTPUT_TOKEN_LIMITS = {"fake": 1000, "fake-1-large": 9000}
+        
+        self.assertEqual(provider.output_token_limit(), 9000)
+        provider.model = "other"
+        self.assertIsNone(provider.output_token_limit())
+
+
+class PackBatchesTest(unittest.TestCase):
+
+    def test_rows_per_call_without_limit(self):
+        service = make_service()
+        budgets = {idx: 6000 for idx in range(5)}
+        
+        batches = service._pack_batches(list(range(5)), budgets, rows_per_call=2)
+        
+        self.assertEqual(batches, [[0, 1], [2, 3], [4]])
+    
+    def test_summed_budget_stays_within_limit(self):
+        service = make_service(limit=16384)
+        budgets = {idx: 6000 for idx in range(6)}
+        
+        batches = service._pack_batches(list(range(6)), budgets, rows_per_call=4)
+        
+        self.assertEqual(batches, [[0, 1], [2, 3], [4, 5]])
+        for batch in batches:
+            self.assertLessEqual(sum(budgets[idx] for idx in batch), 16384)
+    
+    def test_oversized_input_gets_its_own_call(self):
+        service = make_service(limit=4096)
+        budgets = {0: 1000, 1: 5000, 2: 1000, 3: 1000}
+        
+        batches = service._pack_batches([0, 1, 2, 3], budgets, rows_per_call=4)
+        
+        self.assertEqual(batches, [[0], [1], [2, 3]])
+    
+    def test_batch_calls_stay_within_limit(self):
+        for limit, expected in ((8192, [6000, 6000, 6000]), (4096, [4096, 4096, 4096])):
+            with self.subTest(limit=limit):
+                provider = FakeProvider(model="fake-1")
+                provider.OUTPUT_TOKEN_LIMITS = {"fake": limit}
+                requested = []
+                
+                def generate_syllabi(**kwargs):
+                    requested.append(kwargs["max_output_tokens"])
+                    return [syllabus()]
+                
+                provider.generate_syllabi = generate_syllabi
+                service = SyllabusService(provider)
+                
+                service.generate_syllabi_batch(
+                    [CourseInput(f"Topic {idx}", "Advanced") for idx in range(3)],
+                    rows_per_call=4
+                )
+                
+                self.assertEqual(requested, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
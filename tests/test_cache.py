@@ -0,0 +1,118 @@
+"""Tests for the disk and semantic response caches."""
+
+import tempfile
+import unittest
+from unittest import mock
+
+from src.services.cache import DiskCache, SemanticCache
+
+
+class FakeClock:
+    """Replaces time.time() in the cache module."""
+    
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+
+
+class CacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.clock = FakeClock()
+        patcher = mock.patch("src.services.cache.time.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class DiskCacheTest(CacheTestCase):
+
+    def test_round_trip(self):
+        cache = DiskCache(self.directory.name)
+        
+        cache.set("key", {"course_title": "Python"})
+        
+        self.assertEqual(cache.get("key"), {"course_title": "Python"})
+        self.assertIsNone(cache.get("other"))
+    
+    def test_entries_expire(self):
+        cache = DiskCache(self.directory.name, expire=60)
+        cache.set("key", {"course_title": "Python"})
+        
+        self.clock.now += 59
+        self.assertIsNotNone(cache.get("key"))
+        
+        self.clock.now += 2
+        self.assertIsNone(cache.get("key"))
+        # The expired file is removed
+        self.assertIsNone(DiskCache(self.directory.name, expire=None).get("key"))
+    
+    def test_per_entry_expiry_and_no_expiry(self):
+        cache = DiskCache(self.directory.name, expire=None)
+        cache.set("forever", {"n": 1})
+        cache.set("short", {"n": 2}, expire=10)
+        
+        self.clock.now += 10 ** 9
+        
+        self.assertEqual(cache.get("forever"), {"n": 1})
+        self.assertIsNone(cache.get("short"))
+
+
+# Hand-picked vectors: "web dev" is close to "web development" and far
+# from "cooking"
+EMBEDDINGS = {
+    "web development": [1.0, 0.0, 0.0],
+    "web dev": [0.98, 0.2, 0.0],
+    "cooking": [0.0, 0.0, 1.0]
+}
+
+
+class SemanticCacheTest(CacheTestCase):
+
+    def make_cache(self, **kwargs):
+        return SemanticCache(EMBEDDINGS.__getitem__, self.directory.name, **kwargs)
+    
+    def test_similar_text_matches(self):
+        cache = self.make_cache(threshold=0.9)
+        cache.set("web development", "scope", {"course_title": "Web"})
+        
+        self.assertEqual(cache.get("web dev", "scope"), {"course_title": "Web"})
+        self.assertIsNone(cache.get("cooking", "scope"))
+    
+    def test_scopes_are_isolated(self):
+        cache = self.make_cache(threshold=0.9)
+        cache.set("web development", "beginner", {"course_title": "Beginner web"})
+        cache.set("web development", "advanced", {"course_title": "Advanced web"})
+        
+        self.assertEqual(cache.get("web dev", "beginner"), {"course_title": "Beginner web"})
+        self.assertEqual(cache.get("web dev", "advanced"), {"course_title": "Advanced web"})
+        self.assertIsNone(cache.get("web dev", "other"))
+    
+    def test_entries_expire(self):
+        cache = self.make_cache(threshold=0.9, expire=60)
+        cache.set("web development", "scope", {"course_title": "Web"})
+        
+        self.clock.now += 61
+        
+        self.assertIsNone(cache.get("web development", "scope"))
+    
+    def test_index_persists(self):
+        self.make_cache().set("web development", "scope", {"course_title": "Web"})
+        
+        self.assertEqual(
+            self.make_cache().get("web development", "scope"), {"course_title": "Web"}
+        )
+    
+    def test_embedding_failure_is_a_miss(self):
+        cache = self.make_cache()
+        
+        cache.set("unknown topic", "scope", {"course_title": "Lost"})
+        
+        self.assertIsNone(cache.get("unknown topic", "scope"))
+
+
+if __name__ == "__main__":
+    unittest.main()
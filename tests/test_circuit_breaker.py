@@ -0,0 +1,148 @@
+"""Tests for the provider circuit breaker."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from src.models.course_input import CourseInput
+from src.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.services.syllabus_service import SyllabusService
+from tests.fakes import FakeProvider
+
+
+def fail():
+    raise ConnectionError("down")
+
+
+class CircuitBreakerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch(
+            "src.services.circuit_breaker.time.monotonic", lambda: self.now
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def trip(self, breaker):
+        for _ in range(breaker.fail_max):
+            with self.assertRaises(ConnectionError):
+                breaker.call(fail)
+    
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(fail_max=3, reset_timeout=10)
+        calls = []
+        
+        self.trip(breaker)
+        
+        self.assertEqual(breaker.state, "open")
+        with self.assertRaises(CircuitOpenError):
+            breaker.call(calls.append, 1)
+        self.assertEqual(calls, [])
+    
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(fail_max=2)
+        
+        with self.assertRaises(ConnectionError):
+            breaker.call(fail)
+        self.assertEqual(breaker.call(lambda: "ok"), "ok")
+        with self.assertRaises(ConnectionError):
+            breaker.call(fail)
+        
+        self.assertEqual(breaker.state, "closed")
+    
+    def test_half_open_after_timeout(self):
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=10)
+        self.trip(breaker)
+        
+        self.now += 10
+        self.assertEqual(breaker.state, "half-open")
+        with self.assertRaises(ConnectionError):
+            breaker.call(fail)
+        self.assertEqual(breaker.state, "open")
+        
+        self.now += 10
+        self.assertEqual(breaker.call(lambda: "ok"), "ok")
+        self.assertEqual(breaker.state, "closed")
+    
+    def test_excluded_errors_do_not_count(self):
+        breaker = CircuitBreaker(fail_max=1, exclude=(ValueError,))
+        
+        with self.assertRaises(ValueError):
+            breaker.call(int, "x")
+        
+        self.assertEqual(breaker.state, "closed")
+    
+    def test_is_failure_filters_errors(self):
+        breaker = CircuitBreaker(
+            fail_max=1, is_failure=lambda e: isinstance(e, ConnectionError)
+        )
+        
+        with self.assertRaises(KeyError):
+            breaker.call({}.__getitem__, "x")
+        self.assertEqual(breaker.state, "closed")
+        
+        self.trip(breaker)
+        self.assertEqual(breaker.state, "open")
+    
+    def test_call_iter_counts_errors_during_iteration(self):
+        breaker = CircuitBreaker(fail_max=1)
+        
+        def chunks():
+            yield "a"
+            fail()
+        
+        with self.assertRaises(ConnectionError):
+            list(breaker.call_iter(chunks))
+        
+        self.assertEqual(breaker.state, "open")
+    
+    def test_acall(self):
+        breaker = CircuitBreaker(fail_max=1)
+        
+        async def afail():
+            fail()
+        
+        with self.assertRaises(ConnectionError):
+            asyncio.run(breaker.acall(afail))
+        with self.assertRaises(CircuitOpenError):
+            asyncio.run(breaker.acall(afail))
+
+
+class ServiceCircuitBreakerTest(unittest.TestCase):
+
+    def wrapped(self, cause):
+        """Raise a provider error the way the providers do."""
+        try:
+            raise cause
+        except Exception as e:
+            try:
+                raise Exception(f"API error: {e}") from e
+            except Exception as wrapped:
+                return wrapped
+    
+    def test_rejected_requests_do_not_open_the_circuit(self):
+        bad_requests = [self.wrapped(ValueError("400 bad request")) for _ in range(10)]
+        service = SyllabusService(FakeProvider(bad_requests))
+        
+        for _ in range(10):
+            with self.assertRaisesRegex(Exception, "API error"):
+                service.generate_syllabus(CourseInput(topic="Python"))
+        
+        self.assertEqual(service.circuit_breaker.state, "closed")
+    
+    def test_outages_open_the_circuit(self):
+        outages = [self.wrapped(ConnectionError("refused")) for _ in range(5)]
+        service = SyllabusService(FakeProvider(outages))
+        
+        for _ in range(5):
+            with self.assertRaisesRegex(Exception, "API error"):
+                service.generate_syllabus(CourseInput(topic="Python"))
+        
+        self.assertEqual(service.circuit_breaker.state, "open")
+        with self.assertRaises(CircuitOpenError):
+            service.generate_syllabus(CourseInput(topic="Python"))
+
+
+if __name__ == "__main__":
+    unittest.main()
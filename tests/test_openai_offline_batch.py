@@ -0,0 +1,108 @@
+"""Tests for mapping OpenAI Batch API results back to requests."""
+
+import json
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from src.providers.base_provider import SyllabusFormatError
+from src.providers.openai_provider import OpenAIProvider
+from tests.fakes import syllabus
+
+
+def success(custom_id, content):
+    return {
+        "custom_id": custom_id,
+        "response": {
+            "status_code": 200,
+            "body": {"choices": [{"message": {"content": content}}]}
+        },
+        "error": None
+    }
+
+
+def failure(custom_id, message):
+    return {
+        "custom_id": custom_id,
+        "response": {"status_code": 400, "body": {"error": {"message": message}}},
+        "error": None
+    }
+
+
+class FakeBatchClient:
+    """Stands in for the OpenAI client's files and batches APIs."""
+    
+    def __init__(self, status, output=(), errors=()):
+        self.uploaded = None
+        self.batch = SimpleNamespace(
+            id="batch_1",
+            status=status,
+            output_file_id="out" if output else None,
+            error_file_id="err" if errors else None
+        )
+        self.contents = {
+            "out": "\n".join(json.dumps(record) for record in output),
+            "err": "\n".join(json.dumps(record) for record in errors)
+        }
+        self.files = SimpleNamespace(create=self._create_file, content=self._content)
+        self.batches = SimpleNamespace(
+            create=lambda **kwargs: self.batch,
+            retrieve=lambda batch_id: self.batch
+        )
+    
+    def _create_file(self, file, purpose):
+        self.uploaded = file[1].decode("utf-8")
+        return SimpleNamespace(id="input")
+    
+    def _content(self, file_id):
+        return SimpleNamespace(text=self.contents[file_id])
+
+
+class OfflineBatchTest(unittest.TestCase):
+
+    def run_batch(self, client, count):
+        provider = OpenAIProvider("test-key", model="gpt-4o-mini")
+        requests = [
+            {"system_prompt": "system", "user_prompt": f"course {idx}"}
+            for idx in range(count)
+        ]
+        with mock.patch.object(provider, "_get_client", return_value=client), \
+                mock.patch.object(OpenAIProvider, "_transient_errors", return_value=(ConnectionError,)):
+            return provider.generate_syllabi_offline(requests, poll_interval=0)
+    
+    def test_results_are_mapped_by_custom_id(self):
+        client = FakeBatchClient(
+            "completed",
+            output=[
+                success("2", json.dumps(syllabus(course_title="Third"))),
+                success("0", json.dumps(syllabus(course_title="First")))
+            ],
+            errors=[failure("1", "max_tokens is too large")]
+        )
+        
+        results = self.run_batch(client, 4)
+        
+        self.assertEqual(results[0]["course_title"], "First")
+        self.assertEqual(str(results[1]), "OpenAI API error: max_tokens is too large")
+        self.assertEqual(results[2]["course_title"], "Third")
+        self.assertIn("returned no result", str(results[3]))
+        uploaded = [json.loads(line) for line in client.uploaded.splitlines()]
+        self.assertEqual([line["custom_id"] for line in uploaded], ["0", "1", "2", "3"])
+    
+    def test_unparseable_content_is_a_format_error(self):
+        client = FakeBatchClient("completed", output=[success("0", '{"course_title": ')])
+        
+        results = self.run_batch(client, 1)
+        
+        self.assertIsInstance(results[0], SyllabusFormatError)
+        self.assertEqual(results[0].content, '{"course_title": ')
+    
+    def test_failed_batch_raises(self):
+        client = FakeBatchClient("expired")
+        
+        with self.assertRaisesRegex(Exception, "ended with status expired"):
+            self.run_batch(client, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
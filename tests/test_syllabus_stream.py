@@ -0,0 +1,104 @@
+"""Tests for incremental parsing of streamed syllabus responses."""
+
+import json
+import unittest
+
+from src.models.syllabus import Module, Syllabus
+from src.providers.base_provider import SyllabusFormatError
+from src.services.syllabus_stream import SyllabusStream, SyllabusStreamParser
+
+
+SYLLABUS = {
+    "course_title": "Regex {basics}",
+    "course_description": "Quotes \" and brackets ] in strings",
+    "modules": [
+        {"title": "One", "order": 1, "lessons": [{"title": "a\\b"}]},
+        {"title": "Two }", "order": 2, "lessons": []}
+    ],
+    "total_duration_hours": 3
+}
+
+
+def split(text, size):
+    """Split text into chunks of the given size."""
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def make_stream(chunks, repair=None):
+    """Build a stream with plain dict-to-model parsing."""
+    return SyllabusStream(
+        chunks,
+        parse_syllabus=Syllabus.from_dict,
+        parse_module=Module.from_dict,
+        repair=repair
+    )
+
+
+class SyllabusStreamParserTest(unittest.TestCase):
+
+    def test_modules_and_header_across_any_chunking(self):
+        text = json.dumps(SYLLABUS)
+        
+        for size in (1, 2, 3, 7, len(text)):
+            with self.subTest(size=size):
+                parser = SyllabusStreamParser()
+                modules = []
+                for chunk in split(text, size):
+                    modules.extend(parser.feed(chunk))
+                
+                self.assertEqual(modules, SYLLABUS["modules"])
+                self.assertEqual(parser.header["course_title"], "Regex {basics}")
+                self.assertEqual(parser.result(), SYLLABUS)
+    
+    def test_malformed_module_raises_format_error(self):
+        parser = SyllabusStreamParser()
+        
+        with self.assertRaises(SyllabusFormatError) as ctx:
+            parser.feed('{"course_title": "X", "modules": [{"title": oops}')
+        self.assertIn('"course_title": "X"', ctx.exception.content)
+
+
+class SyllabusStreamTest(unittest.TestCase):
+
+    def test_yields_modules_and_full_syllabus(self):
+        stream = make_stream(split(json.dumps(SYLLABUS), 5))
+        
+        titles = [module.title for module in stream]
+        
+        self.assertEqual(titles, ["One", "Two }"])
+        self.assertEqual(stream.header.course_title, "Regex {basics}")
+        self.assertEqual(stream.syllabus.total_duration_hours, 3)
+    
+    def test_malformed_module_is_repaired_with_whole_response(self):
+        chunks = ['{"course_title": "X", "modules": [{"title": oops}', ', {"title": "Y"}]}']
+        seen = []
+        
+        def repair(error):
+            seen.append(error.content)
+            return {"course_title": "Fixed", "modules": []}
+        
+        stream = make_stream(chunks, repair=repair)
+        list(stream)
+        
+        self.assertEqual(seen, ["".join(chunks)])
+        self.assertEqual(stream.syllabus.course_title, "Fixed")
+    
+    def test_format_error_from_provider_is_repaired(self):
+        def chunks():
+            raise SyllabusFormatError("bad", "not json")
+            yield
+        
+        stream = make_stream(chunks(), repair=lambda error: {"course_title": error.content})
+        list(stream)
+        
+        self.assertEqual(stream.syllabus.course_title, "not json")
+    
+    def test_format_error_without_repair_propagates(self):
+        stream = make_stream(['{"modules": [{]}'])
+        
+        with self.assertRaises(SyllabusFormatError):
+            list(stream)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""Tests for syllabus response validation and the repair round-trip."""
+
+import json
+import unittest
+
+from src.models.course_input import CourseInput
+from src.providers.base_provider import SyllabusFormatError
+from src.services.syllabus_service import SyllabusService
+from src.services.syllabus_validation import validate_syllabus_data
+from tests.fakes import FakeProvider, syllabus
+
+
+class ValidateSyllabusDataTest(unittest.TestCase):
+
+    def assertInvalid(self, data, message):
+        with self.assertRaises(SyllabusFormatError) as ctx:
+            validate_syllabus_data(data)
+        self.assertIn(message, str(ctx.exception))
+        self.assertEqual(json.loads(ctx.exception.content), data)
+    
+    def test_valid_data_is_returned(self):
+        data = syllabus()
+        
+        self.assertIs(validate_syllabus_data(data), data)
+    
+    def test_required_fields(self):
+        data = syllabus()
+        del data["course_title"]
+        self.assertInvalid(data, "syllabus.course_title is missing")
+        
+        self.assertInvalid(syllabus(modules=None), "syllabus.modules is missing")
+        
+        data = syllabus()
+        del data["modules"][0]["lessons"][0]["title"]
+        self.assertInvalid(data, "syllabus.modules[0].lessons[0].title is missing")
+    
+    def test_optional_fields_may_be_missing_or_null(self):
+        data = syllabus(target_audience=None, total_duration_hours=None)
+        del data["prerequisites"]
+        module = data["modules"][0]
+        del module["order"]
+        module["lessons"][0]["duration_minutes"] = None
+        
+        self.assertIs(validate_syllabus_data(data), data)
+    
+    def test_optional_fields_are_still_type_checked(self):
+        self.assertInvalid(syllabus(target_audience=3), "syllabus.target_audience must be a string")
+        self.assertInvalid(syllabus(prerequisites="none"), "syllabus.prerequisites must be a list")
+    
+    def test_bool_is_not_a_number(self):
+        self.assertInvalid(
+            syllabus(total_duration_hours=True),
+            "syllabus.total_duration_hours must be a number"
+        )
+        
+        data = syllabus()
+        data["modules"][0]["order"] = False
+        self.assertInvalid(data, "syllabus.modules[0].order must be an integer")
+    
+    def test_number_accepts_int_but_integer_rejects_float(self):
+        data = syllabus(total_duration_hours=12)
+        self.assertIs(validate_syllabus_data(data), data)
+        
+        data = syllabus()
+        data["modules"][0]["lessons"][0]["duration_minutes"] = 30.5
+        self.assertInvalid(
+            data, "syllabus.modules[0].lessons[0].duration_minutes must be an integer"
+        )
+    
+    def test_non_object_response(self):
+        self.assertInvalid(["not", "a", "syllabus"], "syllabus must be an object")
+
+
+class RepairTest(unittest.TestCase):
+
+    def test_invalid_response_is_repaired_once(self):
+        invalid = syllabus(course_title=None)
+        provider = FakeProvider([invalid, syllabus(course_title="Repaired")])
+        service = SyllabusService(provider)
+        
+        result = service.generate_syllabus(CourseInput(topic="Python"))
+        
+        self.assertEqual(result.course_title, "Repaired")
+        self.assertEqual(len(provider.calls), 2)
+        repair_call = provider.calls[1]
+        self.assertEqual(repair_call["temperature"], SyllabusService.REPAIR_TEMPERATURE)
+        self.assertIn("syllabus.course_title is missing", repair_call["user_prompt"])
+        self.assertIn('"course_description": "Learn Python."', repair_call["user_prompt"])
+    
+    def test_repair_is_not_retried(self):
+        provider = FakeProvider([syllabus(modules=None), syllabus(modules="still bad")])
+        service = SyllabusService(provider)
+        
+        with self.assertRaises(SyllabusFormatError):
+            service.generate_syllabus(CourseInput(topic="Python"))
+        self.assertEqual(len(provider.calls), 2)
+    
+    def test_valid_response_is_not_repaired(self):
+        provider = FakeProvider()
+        
+        SyllabusService(provider).generate_syllabus(CourseInput(topic="Python"))
+        
+        self.assertEqual(len(provider.calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()